@@ -24,24 +24,21 @@ def upgrade() -> None:
     # Add new columns to campaigns table
     op.add_column('campaigns', sa.Column('sent_at', sa.TIMESTAMP(timezone=True), nullable=True))
     
-    # Convert existing scheduled_for to timezone-aware if not already
-    op.alter_column('campaigns', 'scheduled_for',
-                    existing_type=sa.TIMESTAMP(),
-                    type_=sa.TIMESTAMP(timezone=True),
-                    nullable=True)
-    
-    # Convert created_at and updated_at to timezone-aware
-    op.alter_column('campaigns', 'created_at',
-                    existing_type=sa.TIMESTAMP(),
-                    type_=sa.TIMESTAMP(timezone=True),
-                    nullable=False,
-                    server_default=sa.text('now()'))
-    
-    op.alter_column('campaigns', 'updated_at',
-                    existing_type=sa.TIMESTAMP(),
-                    type_=sa.TIMESTAMP(timezone=True),
-                    nullable=False,
-                    server_default=sa.text('now()'))
+    # Convert scheduled_for, created_at and updated_at to timezone-aware.
+    # Grouped into a single ALTER TABLE so Postgres rewrites campaigns once
+    # instead of once per column. Existing naive values are stored as UTC.
+    op.execute(
+        """
+        ALTER TABLE campaigns
+            ALTER COLUMN scheduled_for TYPE TIMESTAMPTZ USING scheduled_for AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at SET DEFAULT now(),
+            ALTER COLUMN created_at SET NOT NULL,
+            ALTER COLUMN updated_at TYPE TIMESTAMPTZ USING updated_at AT TIME ZONE 'UTC',
+            ALTER COLUMN updated_at SET DEFAULT now(),
+            ALTER COLUMN updated_at SET NOT NULL
+        """
+    )
     
     # Make company_id explicitly NOT NULL
     op.alter_column('campaigns', 'company_id', nullable=False)
@@ -49,11 +46,6 @@ def upgrade() -> None:
     # Make status NOT NULL with default
     op.alter_column('campaigns', 'status', nullable=False, server_default='draft')
     
-    # Add indexes for performance
-    op.create_index('idx_campaigns_company_id', 'campaigns', ['company_id'])
-    op.create_index('idx_campaigns_status', 'campaigns', ['status'])
-    op.create_index('idx_campaigns_scheduled_for', 'campaigns', ['scheduled_for'])
-    
     # Create campaign_send_logs table
     op.create_table('campaign_send_logs',
         sa.Column('id', sa.UUID(), nullable=False),
@@ -71,43 +63,61 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('ses_message_id', name='uq_ses_message_id')
     )
-    op.create_index('idx_campaign_send_logs_campaign_id', 'campaign_send_logs', ['campaign_id'])
-    op.create_index('idx_campaign_send_logs_email', 'campaign_send_logs', ['subscriber_email'])
-    op.create_index('idx_campaign_send_logs_status', 'campaign_send_logs', ['status'])
-    op.create_index('idx_campaign_send_logs_created_at', 'campaign_send_logs', ['created_at'])
+    
+    # Add indexes for performance.
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, so step out of
+    # the migration transaction; writes to campaigns/campaign_send_logs keep
+    # flowing while the indexes build.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_campaigns_company_id', 'campaigns', ['company_id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_campaigns_status', 'campaigns', ['status'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_campaigns_scheduled_for', 'campaigns', ['scheduled_for'],
+                        postgresql_concurrently=True, if_not_exists=True)
+
+        op.create_index('idx_campaign_send_logs_campaign_id', 'campaign_send_logs', ['campaign_id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_campaign_send_logs_email', 'campaign_send_logs', ['subscriber_email'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_campaign_send_logs_status', 'campaign_send_logs', ['status'],
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_campaign_send_logs_created_at', 'campaign_send_logs', ['created_at'],
+                        postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     
+    # Drop indexes without blocking writes (must run outside a transaction)
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_campaign_send_logs_created_at', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_campaign_send_logs_status', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_campaign_send_logs_email', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_campaign_send_logs_campaign_id', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
+
+        op.drop_index('idx_campaigns_scheduled_for', table_name='campaigns',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_campaigns_status', table_name='campaigns',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_campaigns_company_id', table_name='campaigns',
+                      postgresql_concurrently=True, if_exists=True)
+
     # Drop campaign_send_logs table
-    op.drop_index('idx_campaign_send_logs_created_at', table_name='campaign_send_logs')
-    op.drop_index('idx_campaign_send_logs_status', table_name='campaign_send_logs')
-    op.drop_index('idx_campaign_send_logs_email', table_name='campaign_send_logs')
-    op.drop_index('idx_campaign_send_logs_campaign_id', table_name='campaign_send_logs')
     op.drop_table('campaign_send_logs')
     
-    # Drop indexes from campaigns
-    op.drop_index('idx_campaigns_scheduled_for', table_name='campaigns')
-    op.drop_index('idx_campaigns_status', table_name='campaigns')
-    op.drop_index('idx_campaigns_company_id', table_name='campaigns')
-    
-    # Revert column changes
-    op.alter_column('campaigns', 'updated_at',
-                    existing_type=sa.TIMESTAMP(timezone=True),
-                    type_=sa.TIMESTAMP(),
-                    nullable=False,
-                    server_default=sa.text('now()'))
-    
-    op.alter_column('campaigns', 'created_at',
-                    existing_type=sa.TIMESTAMP(timezone=True),
-                    type_=sa.TIMESTAMP(),
-                    nullable=False,
-                    server_default=sa.text('now()'))
-    
-    op.alter_column('campaigns', 'scheduled_for',
-                    existing_type=sa.TIMESTAMP(timezone=True),
-                    type_=sa.TIMESTAMP(),
-                    nullable=True)
+    # Revert column changes (single table rewrite)
+    op.execute(
+        """
+        ALTER TABLE campaigns
+            ALTER COLUMN updated_at TYPE TIMESTAMP USING updated_at AT TIME ZONE 'UTC',
+            ALTER COLUMN created_at TYPE TIMESTAMP USING created_at AT TIME ZONE 'UTC',
+            ALTER COLUMN scheduled_for TYPE TIMESTAMP USING scheduled_for AT TIME ZONE 'UTC'
+        """
+    )
     
     op.drop_column('campaigns', 'sent_at')
@@ -20,10 +20,26 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema - fix campaign_send_logs columns."""
-    pass  # Column already exists as extra_data, nothing to do
+    # Databases created from an early revision of 2_campaigns_enhancements
+    # have the column as send_metadata. RENAME COLUMN is a catalog-only change
+    # (no table rewrite); the guard makes it a no-op where extra_data exists.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'campaign_send_logs'
+                  AND column_name = 'send_metadata'
+            ) THEN
+                EXECUTE 'ALTER TABLE campaign_send_logs RENAME COLUMN send_metadata TO extra_data';
+            END IF;
+        END $$;
+        """
+    )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    pass  # Nothing to revert
+    pass  # 2_campaigns_enhancements already creates extra_data, nothing to revert
 
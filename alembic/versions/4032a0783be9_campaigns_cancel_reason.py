@@ -0,0 +1,29 @@
+"""campaigns cancel_reason
+
+Revision ID: 4032a0783be9
+Revises: 4b8cc4d06169
+Create Date: 2026-10-15 18:02:13.417285
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4032a0783be9'
+down_revision: Union[str, Sequence[str], None] = '4b8cc4d06169'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable with no default: a catalog-only change, no table rewrite
+    op.add_column('campaigns', sa.Column('cancel_reason', sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('campaigns', 'cancel_reason')
@@ -0,0 +1,44 @@
+"""campaigns 'queued' status for scheduler claims
+
+Revision ID: 4b8cc4d06169
+Revises: d672b524e11d
+Create Date: 2026-10-15 17:26:44.093172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8cc4d06169'
+down_revision: Union[str, Sequence[str], None] = 'd672b524e11d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Swapping the constraint takes ACCESS EXCLUSIVE until the migration
+    # transaction commits, so it is added NOT VALID (no scan) there...
+    op.execute(sa.text("ALTER TABLE campaigns DROP CONSTRAINT IF EXISTS campaigns_status_check"))
+    op.execute(sa.text(
+        "ALTER TABLE campaigns ADD CONSTRAINT campaigns_status_check "
+        "CHECK (status IN ('draft','scheduled','queued','sending','sent','cancelled')) NOT VALID"
+    ))
+
+    # ...and validated in its own transaction afterwards, which only takes
+    # SHARE UPDATE EXCLUSIVE, so reads and writes continue during the scan
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("ALTER TABLE campaigns VALIDATE CONSTRAINT campaigns_status_check"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.text("UPDATE campaigns SET status = 'scheduled' WHERE status = 'queued'"))
+    op.execute(sa.text("ALTER TABLE campaigns DROP CONSTRAINT IF EXISTS campaigns_status_check"))
+    op.execute(sa.text(
+        "ALTER TABLE campaigns ADD CONSTRAINT campaigns_status_check "
+        "CHECK (status IN ('draft','scheduled','sending','sent','cancelled'))"
+    ))
@@ -0,0 +1,40 @@
+"""subscribers trigram index on subscriber_email
+
+Revision ID: 5699db16b331
+Revises: 8e15d03e8a31
+Create Date: 2026-10-15 15:22:48.904613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5699db16b331'
+down_revision: Union[str, Sequence[str], None] = '8e15d03e8a31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sub_email_trgm',
+            'subscribers',
+            ['subscriber_email'],
+            postgresql_using='gin',
+            postgresql_ops={'subscriber_email': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_sub_email_trgm', table_name='subscribers',
+                      postgresql_concurrently=True, if_exists=True)
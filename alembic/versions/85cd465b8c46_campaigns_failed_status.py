@@ -0,0 +1,43 @@
+"""campaigns 'failed' status for batches that exhaust their retries
+
+Revision ID: 85cd465b8c46
+Revises: 4032a0783be9
+Create Date: 2026-10-15 19:14:52.608113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '85cd465b8c46'
+down_revision: Union[str, Sequence[str], None] = '4032a0783be9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Swapping the constraint takes ACCESS EXCLUSIVE until the migration
+    # transaction commits, so it is added NOT VALID (no scan) there...
+    op.execute(sa.text("ALTER TABLE campaigns DROP CONSTRAINT IF EXISTS campaigns_status_check"))
+    op.execute(sa.text(
+        "ALTER TABLE campaigns ADD CONSTRAINT campaigns_status_check "
+        "CHECK (status IN ('draft','scheduled','queued','sending','sent','failed','cancelled')) NOT VALID"
+    ))
+
+    # ...and validated in its own transaction afterwards
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("ALTER TABLE campaigns VALIDATE CONSTRAINT campaigns_status_check"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.text("UPDATE campaigns SET status = 'sent' WHERE status = 'failed'"))
+    op.execute(sa.text("ALTER TABLE campaigns DROP CONSTRAINT IF EXISTS campaigns_status_check"))
+    op.execute(sa.text(
+        "ALTER TABLE campaigns ADD CONSTRAINT campaigns_status_check "
+        "CHECK (status IN ('draft','scheduled','queued','sending','sent','cancelled'))"
+    ))
@@ -0,0 +1,37 @@
+"""subscribers composite company/status/created_at index
+
+Revision ID: 8e15d03e8a31
+Revises: e253e976fa46
+Create Date: 2026-10-15 14:41:09.377105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e15d03e8a31'
+down_revision: Union[str, Sequence[str], None] = 'e253e976fa46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sub_company_status_created',
+            'subscribers',
+            ['company_id', 'status', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_sub_company_status_created', table_name='subscribers',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""campaign_send_logs partial index on in-flight statuses
+
+Revision ID: bcf9c62d97fa
+Revises: beadabcd3ac1
+Create Date: 2026-10-15 10:44:52.730164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bcf9c62d97fa'
+down_revision: Union[str, Sequence[str], None] = 'beadabcd3ac1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_csl_inflight',
+            'campaign_send_logs',
+            ['campaign_id', 'created_at'],
+            postgresql_where=sa.text("status IN ('pending','sending','failed')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Already removed by beadabcd3ac1 on a clean chain; kept for databases
+        # that still carry the full-table status index.
+        op.drop_index('idx_campaign_send_logs_status', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_csl_inflight', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
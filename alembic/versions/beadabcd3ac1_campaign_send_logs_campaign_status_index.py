@@ -0,0 +1,54 @@
+"""campaign_send_logs composite (campaign_id, status) covering index
+
+Revision ID: beadabcd3ac1
+Revises: c394c54711ac
+Create Date: 2026-10-15 10:31:07.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'beadabcd3ac1'
+down_revision: Union[str, Sequence[str], None] = 'c394c54711ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Single-column indexes superseded by the composite one: the explicit idx_*
+# from 2_campaigns_enhancements and the ix_* duplicates from d493eb9aaf6e.
+REPLACED_INDEXES = (
+    ('idx_campaign_send_logs_campaign_id', 'campaign_id'),
+    ('idx_campaign_send_logs_status', 'status'),
+    ('ix_campaign_send_logs_campaign_id', 'campaign_id'),
+    ('ix_campaign_send_logs_status', 'status'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_campaign_send_logs_campaign_status',
+            'campaign_send_logs',
+            ['campaign_id', 'status'],
+            postgresql_include=['subscriber_email', 'ses_message_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for index_name, _ in REPLACED_INDEXES:
+            op.drop_index(index_name, table_name='campaign_send_logs',
+                          postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, column in REPLACED_INDEXES:
+            op.create_index(index_name, 'campaign_send_logs', [column],
+                            postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_campaign_send_logs_campaign_status', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,40 @@
+"""campaign_send_logs server-side uuid default
+
+Revision ID: c394c54711ac
+Revises: d5e6fa8cf770
+Create Date: 2026-10-15 10:12:41.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c394c54711ac'
+down_revision: Union[str, Sequence[str], None] = 'd5e6fa8cf770'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it on 12
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.alter_column(
+        'campaign_send_logs',
+        'id',
+        existing_type=sa.UUID(),
+        server_default=sa.text('gen_random_uuid()'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'campaign_send_logs',
+        'id',
+        existing_type=sa.UUID(),
+        server_default=None,
+    )
@@ -0,0 +1,39 @@
+"""campaigns partial index on scheduled_for for due campaigns
+
+Revision ID: d672b524e11d
+Revises: fcf84091fcd7
+Create Date: 2026-10-15 17:03:29.518846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd672b524e11d'
+down_revision: Union[str, Sequence[str], None] = 'fcf84091fcd7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_campaign_due',
+            'campaigns',
+            ['scheduled_for'],
+            postgresql_include=['id'],
+            postgresql_where=sa.text("status = 'scheduled'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_campaign_due', table_name='campaigns',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""campaign_send_logs uuidv7 default
+
+Revision ID: e253e976fa46
+Revises: bcf9c62d97fa
+Create Date: 2026-10-15 14:03:27.518244
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e253e976fa46'
+down_revision: Union[str, Sequence[str], None] = 'bcf9c62d97fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The ORM now generates UUIDv7 ids client-side (app.utils.uuid7). Where the
+    # pg_uuidv7 extension is available, raw SQL inserts get time-ordered ids too;
+    # otherwise gen_random_uuid() stays as the fallback.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_available_extensions WHERE name = 'pg_uuidv7'
+            ) THEN
+                CREATE EXTENSION IF NOT EXISTS pg_uuidv7;
+                ALTER TABLE campaign_send_logs
+                    ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'campaign_send_logs',
+        'id',
+        existing_type=sa.UUID(),
+        server_default=sa.text('gen_random_uuid()'),
+    )
@@ -0,0 +1,37 @@
+"""subscribers (company_id, created_at DESC, id DESC) keyset index
+
+Revision ID: e6611781fbbf
+Revises: 5699db16b331
+Create Date: 2026-10-15 15:58:13.620471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6611781fbbf'
+down_revision: Union[str, Sequence[str], None] = '5699db16b331'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sub_company_created_id',
+            'subscribers',
+            ['company_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_sub_company_created_id', table_name='subscribers',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,69 @@
+"""campaign_send_logs unique (campaign_id, subscriber_email)
+
+Stop the Celery workers while this runs. A duplicate log written between
+the dedupe and the concurrent index build makes the build fail; rerunning
+the migration (with workers stopped) dedupes again and rebuilds the index.
+
+Revision ID: fcf84091fcd7
+Revises: e6611781fbbf
+Create Date: 2026-10-15 16:41:07.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fcf84091fcd7'
+down_revision: Union[str, Sequence[str], None] = 'e6611781fbbf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep one log per (campaign, email): a terminal row (sent, bounced,
+    # complained) wins, then the most recently updated one
+    op.execute(sa.text(
+        """
+        DELETE FROM campaign_send_logs a
+        USING campaign_send_logs b
+        WHERE a.campaign_id = b.campaign_id
+          AND a.subscriber_email = b.subscriber_email
+          AND (a.status IN ('sent','bounced','complained'), a.updated_at, a.id)
+            < (b.status IN ('sent','bounced','complained'), b.updated_at, b.id)
+        """
+    ))
+
+    with op.get_context().autocommit_block():
+        # A failed CONCURRENTLY build leaves an INVALID index behind, which
+        # if_not_exists would skip and ON CONFLICT can't use; drop it first
+        invalid = op.get_bind().execute(sa.text(
+            """
+            SELECT 1 FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = 'uq_campaign_send_logs_campaign_email'
+              AND NOT i.indisvalid
+            """
+        )).scalar()
+        if invalid:
+            op.drop_index('uq_campaign_send_logs_campaign_email', table_name='campaign_send_logs',
+                          postgresql_concurrently=True, if_exists=True)
+
+        op.create_index(
+            'uq_campaign_send_logs_campaign_email',
+            'campaign_send_logs',
+            ['campaign_id', 'subscriber_email'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_campaign_send_logs_campaign_email', table_name='campaign_send_logs',
+                      postgresql_concurrently=True, if_exists=True)
@@ -2,6 +2,7 @@
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 from kombu import Exchange, Queue
 from app.utils import constants
 
@@ -17,6 +18,14 @@ app = Celery(
 # Broker settings
 app.conf.broker_url = constants.CELERY_BROKER_URL
 app.conf.result_backend = constants.CELERY_RESULT_BACKEND
+app.conf.broker_transport_options = {
+    # Must exceed task_time_limit so acks_late tasks are not redelivered mid-run
+    "visibility_timeout": 3600,
+    # Per-message priorities. On the Redis transport 0 is consumed first and
+    # values are clamped to 0-9 (the reverse of AMQP), see TASK_PRIORITY_*
+    "priority_steps": list(range(10)),
+    "queue_order_strategy": "priority",
+}
 
 # Task settings
 app.conf.task_serializer = "json"
@@ -25,6 +34,20 @@ app.conf.result_serializer = "json"
 app.conf.timezone = "UTC"
 app.conf.enable_utc = True
 
+# Redis priorities: lower runs first. Tasks published without one get
+# TASK_PRIORITY_DEFAULT, behind the campaign pipeline
+TASK_PRIORITY_SCHEDULER = 0
+TASK_PRIORITY_CAMPAIGN = 1
+TASK_PRIORITY_BATCH = 2
+TASK_PRIORITY_SES_EVENTS = 3
+TASK_PRIORITY_DEFAULT = 5
+app.conf.task_default_priority = TASK_PRIORITY_DEFAULT
+
+# Ack after the task finishes and fetch one message at a time, so a worker busy
+# with a long campaign send does not hold prefetched higher-priority tasks
+app.conf.task_acks_late = True
+app.conf.worker_prefetch_multiplier = 1
+
 # Task routing
 default_exchange = Exchange("skymail", type="direct")
 app.conf.task_queues = (
@@ -51,7 +74,10 @@ app.conf.task_queues = (
 app.conf.task_routes = {
     "app.workers.campaign_scheduler.enqueue_due_campaigns": {"queue": "scheduled"},
     "app.workers.campaign_send.send_campaign": {"queue": "campaigns"},
+    "app.workers.campaign_send.finalize_campaign": {"queue": "campaigns"},
+    "app.workers.campaign_send.fail_campaign": {"queue": "campaigns"},
     "app.workers.email_batch.send_campaign_batch": {"queue": "email_batches"},
+    "app.workers.ses_events.process_ses_events": {"queue": "scheduled"},
 }
 
 # Task time limits
@@ -62,6 +88,10 @@ app.conf.task_soft_time_limit = 25 * 60  # 25 minutes soft limit
 app.conf.result_expires = 3600  # Results expire after 1 hour
 
 # ======================== CELERY BEAT SCHEDULE ========================
+# Beat ticks are transient: a lost tick is redone by the next one, which
+# re-derives its work from the database (or the SQS queue). Everything else,
+# notably send_campaign_batch with its recipient list and the chord callbacks,
+# keeps the default persistent delivery.
 
 app.conf.beat_schedule = {
     "enqueue-due-campaigns": {
@@ -69,21 +99,50 @@ app.conf.beat_schedule = {
         "schedule": constants.CAMPAIGN_SCHEDULER_INTERVAL_SECONDS,  # Run every minute
         "options": {
             "queue": "scheduled",
-            "priority": 10,
+            "priority": TASK_PRIORITY_SCHEDULER,
+            "delivery_mode": "transient",
         },
     },
 }
 
+# Bounce/complaint feedback, only when an SES event queue is configured
+if constants.AWS_SES_EVENTS_QUEUE_URL:
+    app.conf.beat_schedule["process-ses-events"] = {
+        "task": "app.workers.ses_events.process_ses_events",
+        "schedule": constants.SES_EVENTS_POLL_INTERVAL_SECONDS,
+        "options": {
+            "queue": "scheduled",
+            "priority": TASK_PRIORITY_SES_EVENTS,
+            "delivery_mode": "transient",
+        },
+    }
+
 # Use database-backed schedule for distributed environments
 app.conf.beat_scheduler = "celery.beat:PersistentScheduler"
 
 
+# ======================== WORKER PROCESS SETUP ========================
+
+@worker_process_init.connect
+def dispose_inherited_db_pool(**kwargs):
+    """
+    Give each forked worker child its own connection pool.
+
+    Connections the parent opened before forking must not be shared across
+    processes; close=False leaves them to the parent and starts fresh.
+    """
+    from app.database.database import engine
+
+    engine.dispose(close=False)
+
+
 # ======================== AUTO-DISCOVER TASKS ========================
 
 app.autodiscover_tasks([
     "app.workers.campaign_scheduler",
     "app.workers.campaign_send",
     "app.workers.email_batch",
+    "app.workers.ses_events",
 ])
 
 
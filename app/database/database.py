@@ -1,12 +1,19 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.utils import constants # or wherever your DB URL is
 
 DATABASE_URL = constants.SQLALCHEMY_DATABASE_URL
+ASYNC_DATABASE_URL = constants.ASYNC_SQLALCHEMY_DATABASE_URL
 
+# Sized for the sync API threadpool by default; Celery children only check
+# out one connection at a time and the pool opens connections lazily
 engine = create_engine(
     DATABASE_URL,
+    pool_size=constants.DB_POOL_SIZE,
+    max_overflow=constants.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=1800,
 )
 
 SessionLocal = sessionmaker(
@@ -15,9 +22,30 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# asyncpg engine for async routes; queries don't block the event loop
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+
+async_session_maker = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    # AsyncSession only checks a connection out of the pool on its first
+    # query, so handlers that bail out early never touch the pool
+    async with async_session_maker() as db:
+        yield db
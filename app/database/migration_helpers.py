@@ -0,0 +1,74 @@
+"""Helpers for alembic data migrations on large tables."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from loguru import logger
+
+
+def batched_update(
+    conn: Connection,
+    table: str,
+    set_clause: str,
+    where_clause: str = "TRUE",
+    batch_size: int = 30000,
+    key: str = "id",
+) -> int:
+    """
+    Backfill rows of a large table in fixed-size batches.
+
+    Matching keys are numbered once into a temp table with
+    ROW_NUMBER() OVER (ORDER BY key), and each batch updates a
+    contiguous rn range through that index. Unlike OFFSET/LIMIT loops,
+    every batch costs the same no matter how far into the table it is.
+
+    Call it inside ``op.get_context().autocommit_block()`` so each batch
+    commits on its own and row locks are released between batches:
+
+        with op.get_context().autocommit_block():
+            batched_update(
+                op.get_bind(),
+                "campaign_send_logs",
+                "status = 'failed'",
+                "status = 'sending'",
+            )
+
+    Args:
+        conn: Connection the migration runs on
+        table: Table to update
+        set_clause: SQL for the SET list (columns of ``table``)
+        where_clause: SQL filter selecting the rows to update
+        batch_size: Rows updated per statement
+        key: Unique, orderable key column of ``table``
+
+    Returns:
+        Total number of rows updated
+    """
+    batch_table = f"_batch_{table}"
+
+    conn.execute(text(f"DROP TABLE IF EXISTS {batch_table}"))
+    conn.execute(text(
+        f"CREATE TEMP TABLE {batch_table} AS "
+        f"SELECT {key}, row_number() OVER (ORDER BY {key}) AS rn "
+        f"FROM {table} WHERE {where_clause}"
+    ))
+    conn.execute(text(f"CREATE INDEX ON {batch_table} (rn)"))
+
+    total = conn.execute(text(f"SELECT count(*) FROM {batch_table}")).scalar_one()
+    logger.info("Backfilling {} rows of {} in batches of {}", total, table, batch_size)
+
+    update_stmt = text(
+        f"UPDATE {table} SET {set_clause} "
+        f"FROM {batch_table} "
+        f"WHERE {table}.{key} = {batch_table}.{key} "
+        f"AND {batch_table}.rn BETWEEN :lo AND :hi"
+    )
+
+    updated = 0
+    for lo in range(1, total + 1, batch_size):
+        hi = lo + batch_size - 1
+        result = conn.execute(update_stmt, {"lo": lo, "hi": hi})
+        updated += result.rowcount
+        logger.info("{}: updated {}/{} rows", table, min(hi, total), total)
+
+    conn.execute(text(f"DROP TABLE {batch_table}"))
+    return updated
@@ -1,9 +1,13 @@
 """FastAPI application main entry point."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from sqlalchemy.exc import SQLAlchemyError
+from loguru import logger
 
 from app.redis.redis_manager import redis_manager
 from app.database.database import engine, SessionLocal, get_db
@@ -14,6 +18,7 @@ from app.modules.subscribers.routes import protected_router as subscriber_manage
 from app.modules.billing.routes import router as billing_router
 from app.modules.campaign.routes import router as campaign_router
 from app.utils import constants
+from app.utils.mail.mailer import mail_client
 
 
 @asynccontextmanager
@@ -29,6 +34,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     await redis_manager.redis_disconnect()
+    await mail_client.close()
 
 
 # Create FastAPI app
@@ -36,7 +42,8 @@ app = FastAPI(
     title="SkyMail",
     description="Newsletter service platform for companies",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # ==================== MIDDLEWARE CONFIGURATION ====================
@@ -62,6 +69,13 @@ app.add_middleware(
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
+# Gzip Middleware (list responses are several KB of repetitive JSON)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5
+)
+
 # Session Middleware for Google OAuth
 app.add_middleware(
     SessionMiddleware,
@@ -70,6 +84,18 @@ app.add_middleware(
     max_age=3600 * 24 * 7  # 7 days
 )
 
+# ==================== EXCEPTION HANDLERS ====================
+
+@app.exception_handler(SQLAlchemyError)
+async def database_error_handler(request: Request, exc: SQLAlchemyError):
+    """Unhandled database errors; the request's session rolls back on teardown."""
+    logger.opt(exception=exc).error("Database error on {} {}", request.method, request.url.path)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"}
+    )
+
+
 # ==================== ROUTES ====================
 
 # Health check endpoint
@@ -0,0 +1,58 @@
+"""In-process token bucket rate limiting for public endpoints."""
+
+import time
+import uuid
+from fastapi import HTTPException, Request, status
+
+
+class TokenBucketLimiter:
+    """
+    FastAPI dependency that allows `rate` requests per `period` seconds for
+    each (company_id, client IP) pair, with bursts up to `rate`.
+
+    Add it to the route's `dependencies=` so excess requests are rejected
+    with 429 before the handler acquires a database connection. Buckets are
+    per worker process. The client IP comes from the ASGI server, which
+    must be configured to trust the load balancer's X-Forwarded-For.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0, max_keys: int = 100_000):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.refill_per_second = rate / period
+        self.max_keys = max_keys
+        # key -> (tokens, last_refill_monotonic), least recently used first
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def _key(self, request: Request) -> str:
+        company_id = request.path_params.get("company_id", "")
+        # Canonical form, so case or brace variants of one id share a bucket
+        try:
+            company_id = str(uuid.UUID(company_id))
+        except ValueError:
+            pass
+        client_ip = request.client.host if request.client else "unknown"
+        return f"{company_id}:{client_ip}"
+
+    async def __call__(self, request: Request) -> None:
+        key = self._key(request)
+        now = time.monotonic()
+
+        # Popped and re-inserted below, which keeps the dict in last-use order
+        tokens, last = self._buckets.pop(key, (self.rate, now))
+        tokens = min(self.rate, tokens + (now - last) * self.refill_per_second)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            retry_after = (1 - tokens) / self.refill_per_second
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(int(retry_after) + 1)}
+            )
+
+        if len(self._buckets) >= self.max_keys:
+            # Drop the least recently used key; an idle bucket has refilled anyway
+            self._buckets.pop(next(iter(self._buckets)), None)
+        self._buckets[key] = (tokens - 1, now)
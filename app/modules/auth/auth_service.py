@@ -58,7 +58,9 @@ class AuthService:
                 json.dumps(registration_data)
             )
             
-            await EmailService.send_otp_email(email, otp, company_name)
+            EmailService.send_in_background(
+                EmailService.send_otp_email(email, otp, company_name)
+            )
             
             logger.info(f"Registration initiated for {email}")
             return True, f"OTP sent to {email}", None
@@ -112,7 +114,9 @@ class AuthService:
             await redis_manager.redis.delete(reg_key)
             
             # Send welcome email
-            await EmailService.send_verification_email(email, reg_data["company_name"])
+            EmailService.send_in_background(
+                EmailService.send_verification_email(email, reg_data["company_name"])
+            )
             
             logger.info(f"Company registered and verified: {email}")
             return True, new_company, "Company registered successfully"
@@ -1,3 +1,4 @@
+import uuid
 from fastapi import HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,7 @@ from app.modules.auth.schemas import (
     CompanyBaseResponse,
 )
 from app.utils import constants
+from app.modules.subscribers.company_cache import invalidate_company_cache
 
 
 class RegisterHandler:
@@ -198,7 +200,7 @@ class LoginHandler:
 
     @staticmethod
     async def logout(
-        company_id: str,
+        company_id: uuid.UUID,
         db: Session
     ):
         success = await LoginService.logout(company_id, db)
@@ -213,15 +215,12 @@ class LoginHandler:
 
     @staticmethod
     async def get_profile(
-        company_id: str,
+        company_id: uuid.UUID,
         db: Session
     ) -> CompanyBaseResponse:
         from app.modules.auth.model import Company
-        import uuid
         
-        company = db.query(Company).filter(
-            Company.id == uuid.UUID(company_id)
-        ).first()
+        company = db.get(Company, company_id)
         
         if not company:
             raise HTTPException(
@@ -233,17 +232,14 @@ class LoginHandler:
 
     @staticmethod
     async def update_profile(
-        company_id: str,
+        company_id: uuid.UUID,
         update_data,
         db: Session
     ):
         from app.modules.auth.model import Company
         from app.modules.auth.schemas import ProfileResponse
-        import uuid
         
-        company = db.query(Company).filter(
-            Company.id == uuid.UUID(company_id)
-        ).first()
+        company = db.get(Company, company_id)
         
         if not company:
             raise HTTPException(
@@ -261,6 +257,7 @@ class LoginHandler:
         db.add(company)
         db.commit()
         db.refresh(company)
+        invalidate_company_cache(company_id)
         
         return ProfileResponse(
             id=company.id,
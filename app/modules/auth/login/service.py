@@ -103,12 +103,12 @@ class LoginService:
 
     @staticmethod
     async def logout(
-        company_id: str,
+        company_id: uuid.UUID,
         db: Session
     ) -> bool:
         try:
             db.query(RefreshToken).filter(
-                RefreshToken.company_id == uuid.UUID(company_id),
+                RefreshToken.company_id == company_id,
                 RefreshToken.revoked_at == None
             ).update(
                 {RefreshToken.revoked_at: datetime.now(timezone.utc)},
@@ -1,4 +1,5 @@
-import uuid
+import hmac
+import secrets
 from typing import Tuple, Optional
 from sqlalchemy.orm import Session
 from loguru import logger
@@ -32,26 +33,39 @@ class PasswordResetService:
             company = db.query(Company).filter(Company.email == email).first()
             if not company:
                 # Don't reveal if email exists (security best practice)
-                logger.info(f"Password reset requested for non-existent email: {email}")
+                logger.info("Password reset requested for non-existent email: {}", email)
                 return True, "If email exists, OTP will be sent"
             
             # Generate OTP
-            otp = str(uuid.uuid4().int)[:6]  # 6-digit OTP
+            otp = f"{secrets.randbelow(1_000_000):06d}"  # 6-digit OTP
             
-            # Store OTP in Redis with 10-minute expiry
+            # Store OTP in Redis with 10-minute expiry, only if none is pending.
+            # SET NX EX is atomic, so repeated requests can't roll new OTPs.
             redis_key = f"password_reset:{email}"
-            await redis_manager.setex(redis_key, 600, otp)
+            was_set = await redis_manager.set(redis_key, otp, ex=600, nx=True)
+            if not was_set:
+                logger.info("Password reset OTP already pending for {}", email)
+                return True, "If email exists, OTP will be sent"
             
-            # Send OTP via email
-            await EmailService.send_password_reset_otp(email, otp)
+            # Send OTP via email off the request path
+            EmailService.send_in_background(
+                PasswordResetService._send_reset_otp(email, otp, redis_key)
+            )
             
-            logger.info(f"Password reset OTP sent to {email}")
             return True, "OTP sent to your email"
             
-        except Exception as e:
-            logger.error(f"Password reset request error for {email}: {str(e)}")
+        except Exception:
+            logger.exception("Password reset request error for {}", email)
             return False, "Failed to process password reset request"
 
+    @staticmethod
+    async def _send_reset_otp(email: str, otp: str, redis_key: str) -> None:
+        """Send the reset OTP; release the slot if delivery failed"""
+        if not await EmailService.send_password_reset_otp(email, otp):
+            await redis_manager.delete(redis_key)
+            return
+        logger.info("Password reset OTP sent to {}", email)
+
     @staticmethod
     async def verify_reset_otp_and_update_password(
         email: str,
@@ -84,22 +98,22 @@ class PasswordResetService:
             if not stored_otp:
                 return False, "OTP expired or not found"
             
-            if stored_otp.strip() != otp.strip():
-                logger.warning(f"OTP mismatch for {email}. Expected: {stored_otp}, Got: {otp}")
+            # Constant-time comparison; bytes so non-ASCII input can't raise
+            if not hmac.compare_digest(stored_otp.encode(), otp.encode()):
+                logger.warning("OTP mismatch for {}", email)
                 return False, "Invalid OTP"
             
             # Update password
             company.password_hash = hash_password(new_password)
             db.commit()
-            db.refresh(company)
             
             # Delete OTP from Redis
             await redis_manager.delete(redis_key)
             
-            logger.info(f"Password reset successful for {email}")
+            logger.info("Password reset successful for {}", email)
             return True, "Password updated successfully"
             
-        except Exception as e:
+        except Exception:
             db.rollback()
-            logger.error(f"Password reset verification error for {email}: {str(e)}")
+            logger.exception("Password reset verification error for {}", email)
             return False, "Failed to reset password"
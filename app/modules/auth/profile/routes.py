@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
 
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/api/auth", tags=["Company Profile"])
 
 @router.get("/profile")
 async def get_profile(
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ) -> CompanyProfileResponse:
     """Get company profile"""
@@ -33,7 +34,7 @@ async def get_profile(
 @router.put("/profile")
 async def update_profile(
     request: CompanyProfileUpdateRequest,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ) -> CompanyProfileResponse:
     """Update company profile (name and website)"""
@@ -56,16 +57,15 @@ async def update_profile(
 @router.post("/profile/image")
 async def upload_profile_image(
     file: UploadFile = File(...),
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ) -> CompanyProfileImageResponse:
     """Upload company profile image"""
-    file_content = await file.read()
-    
-    success, s3_url, message = await CompanyProfileService.upload_profile_image(
+    success, company, message = await CompanyProfileService.upload_profile_image(
         company_id,
-        file_content,
+        file.file,
         file.filename,
+        file.content_type,
         db
     )
     
@@ -75,11 +75,8 @@ async def upload_profile_image(
             detail=message
         )
     
-    # Get updated company to return profile_image_key
-    _, company, _ = await CompanyProfileService.get_company_profile(company_id, db)
-    
     return CompanyProfileImageResponse(
         message=message,
-        s3_url=s3_url,
+        s3_url=CompanyProfileService.get_profile_image_url(company.profile_image_key),
         profile_image_key=company.profile_image_key
     )
@@ -1,40 +1,103 @@
+import asyncio
 import uuid
-import os
-from typing import Tuple, Optional
+import threading
+from types import MappingProxyType
+from typing import BinaryIO, Tuple, Optional
+from sqlalchemy import select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from loguru import logger
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.modules.auth.model import Company
+from app.modules.subscribers.company_cache import invalidate_company_cache
 from app.utils.constants import AWS_S3_BUCKET, AWS_S3_REGION, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
 
+# Stream uploads in 8 MB parts instead of buffering the whole file in memory
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+# boto3 clients are thread-safe; one per process keeps S3 connections alive
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+# Profile image MIME types by lowercase file extension
+_MIME_TYPES = MappingProxyType({
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+})
+_ALLOWED_CONTENT_TYPES = frozenset(_MIME_TYPES.values())
+
+# References to in-flight background deletes so they aren't garbage collected
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
 
 class CompanyProfileService:
     """Service for company profile operations"""
 
     @staticmethod
     def _get_s3_client():
-        """Create S3 client"""
-        logger.info(f"🔌 Creating S3 client")
-        logger.info(f"   Region: {AWS_S3_REGION}")
-        logger.info(f"   Bucket: {AWS_S3_BUCKET}")
-        logger.info(f"   Access Key: {AWS_ACCESS_KEY_ID[:10] if AWS_ACCESS_KEY_ID else 'NOT SET'}...")
+        """Get the shared S3 client, creating it on first use"""
+        global _S3_CLIENT
+        if _S3_CLIENT is None:
+            with _S3_CLIENT_LOCK:
+                if _S3_CLIENT is None:
+                    logger.info("🔌 Creating S3 client")
+                    logger.info("   Region: {}", AWS_S3_REGION)
+                    logger.info("   Bucket: {}", AWS_S3_BUCKET)
+                    logger.info("   Access Key: {}...", AWS_ACCESS_KEY_ID[:10] if AWS_ACCESS_KEY_ID else 'NOT SET')
+                    
+                    _S3_CLIENT = boto3.client(
+                        "s3",
+                        region_name=AWS_S3_REGION,
+                        aws_access_key_id=AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+                        config=Config(
+                            max_pool_connections=50,
+                            retries={"max_attempts": 3, "mode": "adaptive"},
+                        ),
+                    )
+        return _S3_CLIENT
+
+    @staticmethod
+    def _delete_object_in_background(s3_key: str) -> None:
+        """Delete an S3 object without holding up the request"""
+        async def _delete():
+            try:
+                await asyncio.to_thread(
+                    CompanyProfileService._get_s3_client().delete_object,
+                    Bucket=AWS_S3_BUCKET,
+                    Key=s3_key
+                )
+                logger.info("Deleted S3 object: {}", s3_key)
+            except ClientError as e:
+                logger.warning("Failed to delete S3 object {}: {}", s3_key, e)
         
-        return boto3.client(
-            "s3",
-            region_name=AWS_S3_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        )
+        task = asyncio.create_task(_delete())
+        _BACKGROUND_TASKS.add(task)
+        task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+    @staticmethod
+    def get_profile_image_url(s3_key: str) -> str:
+        """Public URL of a profile image stored in S3"""
+        return f"https://{AWS_S3_BUCKET}.s3.{AWS_S3_REGION}.amazonaws.com/{s3_key}"
 
     @staticmethod
     async def update_company_profile(
-        company_id: str,
+        company_id: uuid.UUID,
         company_name: Optional[str],
         website_url: Optional[str],
         db: Session
-    ) -> Tuple[bool, Optional[Company], str]:
+    ) -> Tuple[bool, Optional[Row], str]:
         """
         Update company profile information
         
@@ -45,120 +108,145 @@ class CompanyProfileService:
             db: Database session
             
         Returns:
-            (success, company, message)
+            (success, company row, message)
         """
         try:
-            company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
-            if not company:
-                return False, None, "Company not found"
-            
             # Update only provided fields
+            values = {}
             if company_name:
-                company.company_name = company_name
+                values["company_name"] = company_name
             if website_url:
-                company.website_url = website_url
+                values["website_url"] = website_url
+            
+            # Single round-trip: UPDATE ... RETURNING the updated row
+            if values:
+                stmt = (
+                    update(Company)
+                    .where(Company.id == company_id)
+                    .values(**values)
+                    .returning(*Company.__table__.c)
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                stmt = select(*Company.__table__.c).where(Company.id == company_id)
             
+            company = db.execute(stmt).first()
             db.commit()
-            db.refresh(company)
             
-            logger.info(f"Company profile updated: {company_id}")
+            if not company:
+                return False, None, "Company not found"
+            
+            invalidate_company_cache(company_id)
+            logger.info("Company profile updated: {}", company_id)
             return True, company, "Profile updated successfully"
             
-        except Exception as e:
+        except Exception:
             db.rollback()
-            logger.error(f"Profile update error for {company_id}: {str(e)}")
+            logger.exception("Profile update error for {}", company_id)
             return False, None, "Failed to update profile"
 
     @staticmethod
     async def upload_profile_image(
-        company_id: str,
-        file_content: bytes,
+        company_id: uuid.UUID,
+        file_obj: BinaryIO,
         filename: str,
+        content_type: Optional[str],
         db: Session
-    ) -> Tuple[bool, Optional[str], str]:
+    ) -> Tuple[bool, Optional[Row], str]:
         """
         Upload profile image to S3 and update company
         
         Args:
             company_id: Company UUID
-            file_content: File content bytes
+            file_obj: Readable file object, streamed to S3 in chunks
             filename: Original filename
+            content_type: MIME type sent by the client, if any
             db: Database session
             
         Returns:
-            (success, s3_url, message)
+            (success, company row, message)
         """
+        uploaded = False
         try:
-            company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
-            if not company:
-                return False, None, "Company not found"
-            
             # Generate unique S3 key
-            file_ext = os.path.splitext(filename)[1].lower()
-            s3_key = f"company-profiles/{company_id}/{uuid.uuid4()}{file_ext}"
+            # Only known image extensions make it into the key; anything else
+            # (including path fragments after a '.') gets none
+            _, dot, file_ext = filename.rpartition('.')
+            file_ext = file_ext.lower() if dot else ''
+            if file_ext not in _MIME_TYPES:
+                file_ext = ''
+            s3_key = f"company-profiles/{company_id}/{uuid.uuid4()}{'.' if file_ext else ''}{file_ext}"
             
             # Upload to S3
             s3_client = CompanyProfileService._get_s3_client()
             
-            # Detect MIME type
-            mime_types = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }
-            content_type = mime_types.get(file_ext, 'application/octet-stream')
-            
-            logger.info(f"📤 Uploading to S3:")
-            logger.info(f"   Bucket: {AWS_S3_BUCKET}")
-            logger.info(f"   Key: {s3_key}")
-            logger.info(f"   Content Type: {content_type}")
-            logger.info(f"   File Size: {len(file_content)} bytes")
-            
-            response = s3_client.put_object(
-                Bucket=AWS_S3_BUCKET,
-                Key=s3_key,
-                Body=file_content,
-                ContentType=content_type
-            )
+            # Detect MIME type, preferring the one sent with the upload
+            if content_type not in _ALLOWED_CONTENT_TYPES:
+                content_type = _MIME_TYPES.get(file_ext, 'application/octet-stream')
             
-            logger.info(f"✅ S3 Upload Response: {response.get('ResponseMetadata', {}).get('HTTPStatusCode')}")
-            logger.info(f"   ETag: {response.get('ETag', 'N/A')}")
+            logger.info("📤 Uploading to S3:")
+            logger.info("   Bucket: {}", AWS_S3_BUCKET)
+            logger.info("   Key: {}", s3_key)
+            logger.info("   Content Type: {}", content_type)
             
-            # Delete old profile image if exists
-            if company.profile_image_key:
-                try:
-                    s3_client.delete_object(
-                        Bucket=AWS_S3_BUCKET,
-                        Key=company.profile_image_key
-                    )
-                    logger.info(f"Deleted old profile image: {company.profile_image_key}")
-                except ClientError as e:
-                    logger.warning(f"Failed to delete old image: {str(e)}")
+            # boto3 blocks; keep it off the event loop
+            await asyncio.to_thread(
+                s3_client.upload_fileobj,
+                file_obj,
+                AWS_S3_BUCKET,
+                s3_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=S3_TRANSFER_CONFIG,
+            )
+            uploaded = True
             
-            # Generate S3 URL
-            s3_url = f"https://{AWS_S3_BUCKET}.s3.{AWS_S3_REGION}.amazonaws.com/{s3_key}"
+            logger.info("✅ S3 Upload complete: {}", s3_key)
             
-            # Update company profile_image_key
-            company.profile_image_key = s3_key
+            # Swap in the new key and read the previous one in a single
+            # UPDATE ... FROM (SELECT ... FOR UPDATE) ... RETURNING
+            previous = (
+                select(Company.id, Company.profile_image_key)
+                .where(Company.id == company_id)
+                .with_for_update()
+                .subquery()
+            )
+            company = db.execute(
+                update(Company)
+                .where(Company.id == previous.c.id)
+                .values(profile_image_key=s3_key)
+                .returning(
+                    *Company.__table__.c,
+                    previous.c.profile_image_key.label("previous_image_key"),
+                )
+                .execution_options(synchronize_session=False)
+            ).first()
             db.commit()
-            db.refresh(company)
             
-            logger.info(f"Profile image uploaded for {company_id}: {s3_key}")
-            return True, s3_url, "Profile image uploaded successfully"
+            if not company:
+                CompanyProfileService._delete_object_in_background(s3_key)
+                return False, None, "Company not found"
+            
+            # Delete old profile image if exists; the response doesn't wait for it
+            if company.previous_image_key:
+                CompanyProfileService._delete_object_in_background(company.previous_image_key)
+            
+            logger.info("Profile image uploaded for {}: {}", company_id, s3_key)
+            return True, company, "Profile image uploaded successfully"
             
-        except ClientError as e:
-            logger.error(f"S3 upload error for {company_id}: {str(e)}")
+        except ClientError:
+            logger.exception("S3 upload error for {}", company_id)
             return False, None, "Failed to upload image to S3"
-        except Exception as e:
+        except Exception:
             db.rollback()
-            logger.error(f"Profile image upload error for {company_id}: {str(e)}")
+            logger.exception("Profile image upload error for {}", company_id)
+            # Nothing points at the new object once the UPDATE rolled back
+            if uploaded:
+                CompanyProfileService._delete_object_in_background(s3_key)
             return False, None, "Failed to upload profile image"
 
     @staticmethod
     async def get_company_profile(
-        company_id: str,
+        company_id: uuid.UUID,
         db: Session
     ) -> Tuple[bool, Optional[Company], str]:
         """
@@ -172,12 +260,12 @@ class CompanyProfileService:
             (success, company, message)
         """
         try:
-            company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
+            company = db.get(Company, company_id)
             if not company:
                 return False, None, "Company not found"
             
             return True, company, "Profile retrieved successfully"
             
-        except Exception as e:
-            logger.error(f"Profile retrieval error for {company_id}: {str(e)}")
+        except Exception:
+            logger.exception("Profile retrieval error for {}", company_id)
             return False, None, "Failed to retrieve profile"
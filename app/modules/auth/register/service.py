@@ -142,7 +142,9 @@ class RegisterService:
             await redis_manager.redis.delete(otp_key)
             await redis_manager.redis.delete(reg_key)
             
-            await EmailService.send_verification_email(email, reg_data["company_name"])
+            EmailService.send_in_background(
+                EmailService.send_verification_email(email, reg_data["company_name"])
+            )
             
             logger.info(f"Company registered and verified: {email}")
             return True, new_company, "Company registered successfully"
@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
 
@@ -26,7 +27,7 @@ security = HTTPBearer()
 async def get_current_company(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> str:
+) -> uuid.UUID:
     token = credentials.credentials
     
     try:
@@ -39,9 +40,10 @@ async def get_current_company(
                 detail="Could not validate credentials"
             )
         
-        return company_id
+        # Parsed once here so routes and services receive a UUID
+        return uuid.UUID(company_id)
         
-    except JWTError:
+    except (JWTError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
@@ -122,7 +124,7 @@ async def refresh_token(
     description="Logout and revoke refresh tokens."
 )
 async def logout(
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await LoginHandler.logout(company_id, db)
@@ -135,7 +137,7 @@ async def logout(
     description="Get details of the currently authenticated company."
 )
 async def get_profile(
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await LoginHandler.get_profile(company_id, db)
@@ -148,16 +150,13 @@ async def get_profile(
     description="Get the company profile information."
 )
 async def get_company_profile(
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     from app.modules.auth.schemas import ProfileResponse
     from app.modules.auth.model import Company
-    import uuid
     
-    company = db.query(Company).filter(
-        Company.id == uuid.UUID(company_id)
-    ).first()
+    company = db.get(Company, company_id)
     
     if not company:
         raise HTTPException(
@@ -185,7 +184,7 @@ async def get_company_profile(
 )
 async def update_company_profile(
     request: UpdateProfileRequest,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await LoginHandler.update_profile(company_id, request, db)
@@ -2,6 +2,7 @@
 Billing routes for premium subscription management.
 """
 
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -32,7 +33,7 @@ router = APIRouter(
 )
 async def create_premium_order(
     request: CreateOrderRequest,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     """
@@ -76,7 +77,7 @@ async def create_premium_order(
 )
 async def verify_payment(
     request: VerifyPaymentRequest,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     """
@@ -117,7 +118,7 @@ async def verify_payment(
     description="Retrieve all payment records for the authenticated company."
 )
 async def get_payment_history(
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     """
@@ -147,7 +148,7 @@ async def get_payment_history(
     description="Get current subscription tier and status for the company."
 )
 async def get_subscription_status(
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     """
@@ -160,10 +161,9 @@ async def get_subscription_status(
     - Max subscribers allowed
     """
     from app.modules.auth.model import Company
-    import uuid
     
     company = db.query(Company).filter(
-        Company.id == uuid.UUID(company_id)
+        Company.id == company_id
     ).first()
     
     if not company:
@@ -14,6 +14,7 @@ from loguru import logger
 from app.utils import constants
 from app.modules.auth.model import Company
 from app.modules.billing.model import Payment
+from app.modules.subscribers.company_cache import invalidate_company_cache
 
 
 class BillingService:
@@ -34,7 +35,7 @@ class BillingService:
     )
     
     @staticmethod
-    def create_order(company_id: str, db: Session) -> Tuple[bool, dict]:
+    def create_order(company_id: uuid.UUID, db: Session) -> Tuple[bool, dict]:
         """
         Create a Razorpay order for premium subscription.
         
@@ -48,7 +49,7 @@ class BillingService:
         try:
             # Verify company exists
             company = db.query(Company).filter(
-                Company.id == uuid.UUID(company_id)
+                Company.id == company_id
             ).first()
             
             if not company:
@@ -85,7 +86,7 @@ class BillingService:
             # Store pending payment record
             payment = Payment(
                 id=uuid.uuid4(),
-                company_id=uuid.UUID(company_id),
+                company_id=company_id,
                 razorpay_order_id=razorpay_order["id"],
                 amount=BillingService.PREMIUM_PRICE_AMOUNT,
                 currency="INR",
@@ -166,7 +167,7 @@ class BillingService:
     
     @staticmethod
     def verify_and_activate_premium(
-        company_id: str,
+        company_id: uuid.UUID,
         order_id: str,
         payment_id: str,
         signature: str,
@@ -197,7 +198,7 @@ class BillingService:
             # Find payment record
             payment = db.query(Payment).filter(
                 Payment.razorpay_order_id == order_id,
-                Payment.company_id == uuid.UUID(company_id)
+                Payment.company_id == company_id
             ).first()
             
             if not payment:
@@ -223,7 +224,7 @@ class BillingService:
             
             # Update company to premium
             company = db.query(Company).filter(
-                Company.id == uuid.UUID(company_id)
+                Company.id == company_id
             ).first()
             
             if not company:
@@ -239,6 +240,7 @@ class BillingService:
             company.max_subscribers = 999999  # Unlimited for premium
             
             db.commit()
+            invalidate_company_cache(company.id)
             
             logger.info(
                 f"Premium activated for company {company_id}. "
@@ -263,7 +265,7 @@ class BillingService:
             }
     
     @staticmethod
-    def get_payment_history(company_id: str, db: Session) -> Tuple[bool, dict]:
+    def get_payment_history(company_id: uuid.UUID, db: Session) -> Tuple[bool, dict]:
         """
         Get payment history for a company.
         
@@ -276,7 +278,7 @@ class BillingService:
         """
         try:
             payments = db.query(Payment).filter(
-                Payment.company_id == uuid.UUID(company_id)
+                Payment.company_id == company_id
             ).order_by(Payment.created_at.desc()).all()
             
             payment_list = [
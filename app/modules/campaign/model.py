@@ -1,6 +1,6 @@
 import uuid
 import datetime
-from sqlalchemy import String, TIMESTAMP, ForeignKey,CheckConstraint, func, Index
+from sqlalchemy import String, TIMESTAMP, ForeignKey,CheckConstraint, func, Index, text
 from sqlalchemy.dialects.postgresql import UUID,JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,11 +17,19 @@ class Campaign(Base):
     __tablename__ = "campaigns"
     __table_args__ = (
         CheckConstraint(
-            "status IN ('draft','scheduled','sending','sent','cancelled')"
+            "status IN ('draft','scheduled','queued','sending','sent','failed','cancelled')",
+            name="campaigns_status_check",
         ),
         Index("idx_campaigns_company_id", "company_id"),
         Index("idx_campaigns_status", "status"),
         Index("idx_campaigns_scheduled_for", "scheduled_for"),
+        # Scheduler tick: only pending rows, id included for index-only scans
+        Index(
+            "idx_campaign_due",
+            "scheduled_for",
+            postgresql_include=["id"],
+            postgresql_where=text("status = 'scheduled'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -53,7 +61,8 @@ class Campaign(Base):
     # Timezone for display purposes (e.g., 'America/New_York')
     send_timezone: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
-    # Status lifecycle: draft → scheduled → sending → sent OR cancelled
+    # Status lifecycle: draft → scheduled → queued → sending → sent OR failed
+    # OR cancelled
     status: Mapped[str] = mapped_column(
         String(20),
         default="draft",
@@ -61,6 +70,10 @@ class Campaign(Base):
         index=True
     )
 
+    # Why the send pipeline cancelled or failed the campaign (e.g.
+    # template_not_found); NULL for user cancellations
+    cancel_reason: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
     # Timestamp when campaign was fully sent
     sent_at: Mapped[datetime.datetime | None] = mapped_column(
         TIMESTAMP(timezone=True),
@@ -48,10 +48,9 @@ async def create_campaign(
     - scheduled_for must be UTC (format: 2026-01-25T17:30:00Z)
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         campaign = CampaignService.create_campaign(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             name=req.name,
             template_id=req.template_id,
             constants_values=req.constants_values,
@@ -83,10 +82,9 @@ async def schedule_campaign(
     Once scheduled, the campaign will be picked up by Celery Beat scheduler.
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         campaign = CampaignService.schedule_campaign(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             campaign_id=campaign_id,
             scheduled_for=req.scheduled_for,
             send_timezone=req.send_timezone or "UTC",
@@ -113,10 +111,9 @@ async def cancel_campaign(
     Once sending/sent, campaigns cannot be cancelled.
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         campaign = CampaignService.cancel_campaign(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             campaign_id=campaign_id,
         )
         return campaign
@@ -145,10 +142,9 @@ async def reschedule_campaign(
     Required format: ISO 8601 with Z suffix (e.g., 2026-01-25T17:30:00Z).
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         campaign = CampaignService.reschedule_campaign(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             campaign_id=campaign_id,
             scheduled_for=request.scheduled_for,
             send_timezone=request.send_timezone or "UTC",
@@ -172,10 +168,9 @@ async def get_campaign(
     Get campaign details.
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         campaign = CampaignService.get_campaign(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             campaign_id=campaign_id,
         )
         return campaign
@@ -197,12 +192,11 @@ async def list_campaigns(
     List campaigns for your company.
     
     Optional filters:
-    - status: Filter by campaign status (draft, scheduled, sending, sent, cancelled)
+    - status: Filter by campaign status (draft, scheduled, queued, sending, sent, failed, cancelled)
     """
-    company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
     campaigns, total = CampaignService.list_campaigns(
         db=db,
-        company_id=company_uuid,
+        company_id=company_id,
         skip=skip,
         limit=limit,
         status=status,
@@ -231,10 +225,9 @@ async def get_campaign_status(
     - total_recipients: Total emails in this campaign
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         status_info = CampaignService.get_campaign_status(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             campaign_id=campaign_id,
         )
         return status_info
@@ -255,14 +248,13 @@ async def delete_campaign(
     
     Restrictions:
     - Can only delete campaigns in draft or scheduled status
-    - Cannot delete campaigns that are sending or already sent
+    - Cannot delete campaigns that are queued, sending or already sent
     - All associated send logs will be deleted (cascade delete)
     """
     try:
-        company_uuid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
         CampaignService.delete_campaign(
             db=db,
-            company_id=company_uuid,
+            company_id=company_id,
             campaign_id=campaign_id,
         )
         return None
@@ -50,6 +50,7 @@ class CampaignResponse(BaseModel):
     scheduled_for: Optional[datetime]
     send_timezone: Optional[str]
     status: str
+    cancel_reason: Optional[str] = None
     sent_at: Optional[datetime]
     constants_values: dict = Field(default_factory=dict, description="Values for template constants")
     created_at: datetime
@@ -73,6 +74,7 @@ class CampaignStatusResponse(BaseModel):
     
     id: uuid.UUID
     status: str
+    cancel_reason: Optional[str] = None
     sent_count: int = 0
     failed_count: int = 0
     total_recipients: int = 0
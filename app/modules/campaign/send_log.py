@@ -1,10 +1,11 @@
 import uuid
 import datetime
-from sqlalchemy import String, TIMESTAMP, ForeignKey, CheckConstraint, func, Index, Text
+from sqlalchemy import String, TIMESTAMP, ForeignKey, CheckConstraint, func, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base
+from app.utils.uuid7 import uuid7
 
 
 class CampaignSendLog(Base):
@@ -22,23 +23,45 @@ class CampaignSendLog(Base):
         CheckConstraint(
             "status IN ('pending','sending','sent','failed','bounced','complained')"
         ),
-        Index("idx_campaign_send_logs_campaign_id", "campaign_id"),
+        # Covers "rows of campaign X in status Y" with an index-only scan;
+        # also serves campaign_id-only lookups as the leading column.
+        Index(
+            "idx_campaign_send_logs_campaign_status",
+            "campaign_id",
+            "status",
+            postgresql_include=["subscriber_email", "ses_message_id"],
+        ),
         Index("idx_campaign_send_logs_email", "subscriber_email"),
-        Index("idx_campaign_send_logs_status", "status"),
+        # One log per recipient per campaign; batch writes upsert on it
+        Index(
+            "uq_campaign_send_logs_campaign_email",
+            "campaign_id",
+            "subscriber_email",
+            unique=True,
+        ),
+        # Only the small in-flight working set; sent rows never enter it
+        Index(
+            "idx_csl_inflight",
+            "campaign_id",
+            "created_at",
+            postgresql_where=text("status IN ('pending','sending','failed')"),
+        ),
         Index("idx_campaign_send_logs_created_at", "created_at"),
     )
 
+    # Time-ordered so bulk inserts append to the right edge of the PK index;
+    # the server default only covers rows inserted outside the ORM
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7,
+        server_default=func.gen_random_uuid()
     )
 
     campaign_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("campaigns.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     subscriber_email: Mapped[str] = mapped_column(
@@ -57,8 +80,7 @@ class CampaignSendLog(Base):
     status: Mapped[str] = mapped_column(
         String(20),
         default="pending",
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Error details if failed
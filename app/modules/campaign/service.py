@@ -456,6 +456,7 @@ class CampaignService:
         return {
             "id": campaign.id,
             "status": campaign.status,
+            "cancel_reason": campaign.cancel_reason,
             "sent_count": sent_count,
             "failed_count": failed_count,
             "total_recipients": total_recipients,
@@ -474,7 +475,7 @@ class CampaignService:
         
         Restrictions:
         - Can only delete campaigns in draft or scheduled status
-        - Cannot delete campaigns that are sending or already sent
+        - Cannot delete campaigns that are queued, sending, sent or failed (partly sent)
         - All campaign send logs will be cascade deleted
         
         Args:
@@ -498,8 +499,8 @@ class CampaignService:
         if not campaign:
             raise ResourceNotFoundError(f"Campaign {campaign_id} not found")
         
-        # Prevent deletion of campaigns that are sending or already sent
-        if campaign.status in ["sending", "sent"]:
+        # Prevent deletion of campaigns that are queued, sending, sent or failed
+        if campaign.status in ["queued", "sending", "sent", "failed"]:
             raise AppPermissionError(
                 f"Cannot delete campaign in '{campaign.status}' status. "
                 f"Only draft and scheduled campaigns can be deleted."
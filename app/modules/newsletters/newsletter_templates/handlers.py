@@ -1,3 +1,4 @@
+import uuid
 from typing import Optional, List
 from fastapi import HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
@@ -17,7 +18,7 @@ class TemplateHandler:
 
     @staticmethod
     async def create_template(
-        company_id: str,
+        company_id: uuid.UUID,
         request: TemplateCreateRequest,
         db: Session
     ) -> TemplateResponse:
@@ -35,7 +36,7 @@ class TemplateHandler:
 
     @staticmethod
     async def create_template_with_assets(
-        company_id: str,
+        company_id: uuid.UUID,
         request: TemplateCreateRequest,
         files: Optional[List[UploadFile]],
         db: Session
@@ -78,7 +79,7 @@ class TemplateHandler:
 
     @staticmethod
     async def update_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         request: TemplateUpdateRequest,
         db: Session
@@ -97,7 +98,7 @@ class TemplateHandler:
 
     @staticmethod
     async def update_template_with_assets(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         request: TemplateUpdateRequest,
         files: Optional[List[UploadFile]],
@@ -141,7 +142,7 @@ class TemplateHandler:
 
     @staticmethod
     async def get_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ) -> TemplateResponse:
@@ -157,7 +158,7 @@ class TemplateHandler:
 
     @staticmethod
     async def list_templates(
-        company_id: str,
+        company_id: uuid.UUID,
         db: Session,
         page: int = 1,
         limit: int = 20
@@ -166,7 +167,7 @@ class TemplateHandler:
 
     @staticmethod
     async def deactivate_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ):
@@ -184,7 +185,7 @@ class TemplateHandler:
 
     @staticmethod
     async def delete_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ):
@@ -206,7 +207,7 @@ class TemplateHandler:
 
     @staticmethod
     async def get_versions(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ):
@@ -224,7 +225,7 @@ class TemplateHandler:
 
     @staticmethod
     async def get_version(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         version_id: str,
         db: Session
@@ -246,7 +247,7 @@ class AssetHandler:
 
     @staticmethod
     async def upload_asset(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         file: UploadFile,
         db: Session
@@ -267,7 +268,7 @@ class AssetHandler:
 
     @staticmethod
     async def delete_asset(
-        company_id: str,
+        company_id: uuid.UUID,
         asset_id: str,
         db: Session
     ):
@@ -283,7 +284,7 @@ class AssetHandler:
 
     @staticmethod
     async def get_assets(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ):
@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, UploadFile, File, Query, Form
 from typing import List, Optional
 from sqlalchemy.orm import Session
@@ -27,7 +28,7 @@ async def create_template(
     text_content: Optional[str] = Form(None),
     constants: Optional[str] = Form(None),
     files: Optional[List[UploadFile]] = File(None),
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     request = TemplateCreateRequest(
@@ -57,7 +58,7 @@ async def update_template(
     constants: Optional[str] = Form(None),
     is_active: Optional[bool] = Form(None),
     files: Optional[List[UploadFile]] = File(None),
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     request = TemplateUpdateRequest(
@@ -81,7 +82,7 @@ async def update_template(
 )
 async def get_template(
     template_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await TemplateHandler.get_template(company_id, template_id, db)
@@ -96,7 +97,7 @@ async def get_template(
 async def list_templates(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await TemplateHandler.list_templates(company_id, db, page, limit)
@@ -110,7 +111,7 @@ async def list_templates(
 )
 async def deactivate_template(
     template_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await TemplateHandler.deactivate_template(company_id, template_id, db)
@@ -124,7 +125,7 @@ async def deactivate_template(
 )
 async def delete_template(
     template_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await TemplateHandler.delete_template(company_id, template_id, db)
@@ -138,7 +139,7 @@ async def delete_template(
 )
 async def get_versions(
     template_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await TemplateHandler.get_versions(company_id, template_id, db)
@@ -153,7 +154,7 @@ async def get_versions(
 async def get_version(
     template_id: str,
     version_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await TemplateHandler.get_version(company_id, template_id, version_id, db)
@@ -168,7 +169,7 @@ async def get_version(
 async def upload_asset(
     template_id: str,
     file: UploadFile = File(...),
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await AssetHandler.upload_asset(company_id, template_id, file, db)
@@ -182,7 +183,7 @@ async def upload_asset(
 )
 async def delete_asset(
     asset_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await AssetHandler.delete_asset(company_id, asset_id, db)
@@ -196,7 +197,7 @@ async def delete_asset(
 )
 async def get_assets(
     template_id: str,
-    company_id: str = Depends(get_current_company),
+    company_id: uuid.UUID = Depends(get_current_company),
     db: Session = Depends(get_db)
 ):
     return await AssetHandler.get_assets(company_id, template_id, db)
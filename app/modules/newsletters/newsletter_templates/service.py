@@ -26,20 +26,20 @@ class TemplateService:
 
     @staticmethod
     async def create_template(
-        company_id: str,
+        company_id: uuid.UUID,
         request: TemplateCreateRequest,
         db: Session
     ) -> Tuple[bool, Optional[NewsletterTemplate], str]:
         try:
             # Check if company is on free tier and already has a template
-            company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
+            company = db.query(Company).filter(Company.id == company_id).first()
             if not company:
                 return False, None, "Company not found"
             
             if company.subscription_tier == "free":
                 # Free tier can only have 1 template
                 template_count = db.query(func.count(NewsletterTemplate.id)).filter(
-                    NewsletterTemplate.company_id == uuid.UUID(company_id)
+                    NewsletterTemplate.company_id == company_id
                 ).scalar() or 0
                 
                 if template_count >= 1:
@@ -49,7 +49,7 @@ class TemplateService:
             
             new_template = NewsletterTemplate(
                 id=template_id,
-                company_id=uuid.UUID(company_id),
+                company_id=company_id,
                 name=request.name,
                 subject=request.subject,
                 html_content=request.html_content,
@@ -84,7 +84,7 @@ class TemplateService:
 
     @staticmethod
     async def update_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         request: TemplateUpdateRequest,
         db: Session
@@ -92,7 +92,7 @@ class TemplateService:
         try:
             template = db.query(NewsletterTemplate).filter(
                 NewsletterTemplate.id == uuid.UUID(template_id),
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).first()
             
             if not template:
@@ -129,7 +129,7 @@ class TemplateService:
             
             if content_changed:
                 # Check free tier version limit
-                company = db.query(Company).filter(Company.id == uuid.UUID(company_id)).first()
+                company = db.query(Company).filter(Company.id == company_id).first()
                 if company and company.subscription_tier == "free":
                     version_count = db.query(NewsletterTemplateVersion).filter(
                         NewsletterTemplateVersion.template_id == uuid.UUID(template_id)
@@ -163,14 +163,14 @@ class TemplateService:
 
     @staticmethod
     async def get_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ) -> Optional[NewsletterTemplate]:
         try:
             template = db.query(NewsletterTemplate).filter(
                 NewsletterTemplate.id == uuid.UUID(template_id),
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).first()
             return template
         except Exception as e:
@@ -179,7 +179,7 @@ class TemplateService:
 
     @staticmethod
     async def list_templates(
-        company_id: str,
+        company_id: uuid.UUID,
         db: Session,
         page: int = 1,
         limit: int = 20
@@ -188,11 +188,11 @@ class TemplateService:
             skip = (page - 1) * limit
             
             total = db.query(func.count(NewsletterTemplate.id)).filter(
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).scalar() or 0
             
             templates = db.query(NewsletterTemplate).filter(
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).order_by(desc(NewsletterTemplate.updated_at)).offset(skip).limit(limit).all()
             
             items = [
@@ -219,14 +219,14 @@ class TemplateService:
 
     @staticmethod
     async def deactivate_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ) -> Tuple[bool, str]:
         try:
             template = db.query(NewsletterTemplate).filter(
                 NewsletterTemplate.id == uuid.UUID(template_id),
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).first()
             
             if not template:
@@ -246,7 +246,7 @@ class TemplateService:
 
     @staticmethod
     async def delete_template(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ) -> Tuple[bool, str, List[Dict[str, Any]]]:
@@ -257,7 +257,7 @@ class TemplateService:
         try:
             template = db.query(NewsletterTemplate).filter(
                 NewsletterTemplate.id == uuid.UUID(template_id),
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).first()
             
             if not template:
@@ -266,7 +266,7 @@ class TemplateService:
             # Get all campaigns using this template (will be cascade deleted)
             affected_campaigns = db.query(Campaign).filter(
                 Campaign.template_id == uuid.UUID(template_id),
-                Campaign.company_id == uuid.UUID(company_id)
+                Campaign.company_id == company_id
             ).all()
             
             affected_campaign_data = [
@@ -295,14 +295,14 @@ class TemplateService:
 
     @staticmethod
     async def get_template_versions(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ) -> List[TemplateVersionResponse]:
         try:
             template = db.query(NewsletterTemplate).filter(
                 NewsletterTemplate.id == uuid.UUID(template_id),
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).first()
             
             if not template:
@@ -330,7 +330,7 @@ class TemplateService:
 
     @staticmethod
     async def get_version(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         version_id: str,
         db: Session
@@ -338,7 +338,7 @@ class TemplateService:
         try:
             template = db.query(NewsletterTemplate).filter(
                 NewsletterTemplate.id == uuid.UUID(template_id),
-                NewsletterTemplate.company_id == uuid.UUID(company_id)
+                NewsletterTemplate.company_id == company_id
             ).first()
             
             if not template:
@@ -21,7 +21,7 @@ class AssetService:
 
     @staticmethod
     async def upload_asset(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         file_content: bytes,
         filename: str,
@@ -42,7 +42,7 @@ class AssetService:
 
             asset = TemplateAsset(
                 id=uuid.uuid4(),
-                company_id=uuid.UUID(company_id),
+                company_id=company_id,
                 template_id=uuid.UUID(template_id),
                 file_url=file_url,
                 file_type=file_extension,
@@ -62,14 +62,14 @@ class AssetService:
 
     @staticmethod
     async def delete_asset(
-        company_id: str,
+        company_id: uuid.UUID,
         asset_id: str,
         db: Session
     ) -> Tuple[bool, str]:
         try:
             asset = db.query(TemplateAsset).filter(
                 TemplateAsset.id == uuid.UUID(asset_id),
-                TemplateAsset.company_id == uuid.UUID(company_id)
+                TemplateAsset.company_id == company_id
             ).first()
 
             if not asset:
@@ -96,13 +96,13 @@ class AssetService:
 
     @staticmethod
     async def get_template_assets(
-        company_id: str,
+        company_id: uuid.UUID,
         template_id: str,
         db: Session
     ) -> List[TemplateAsset]:
         try:
             assets = db.query(TemplateAsset).filter(
-                TemplateAsset.company_id == uuid.UUID(company_id),
+                TemplateAsset.company_id == company_id,
                 TemplateAsset.template_id == uuid.UUID(template_id)
             ).all()
             return assets
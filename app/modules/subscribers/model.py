@@ -1,6 +1,6 @@
 import uuid
 import datetime
-from sqlalchemy import String, TIMESTAMP, ForeignKey, UniqueConstraint, Index, func
+from sqlalchemy import String, TIMESTAMP, ForeignKey, UniqueConstraint, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -19,6 +19,17 @@ class Subscriber(Base):
         Index("idx_subscribers_company_id", "company_id"),
         Index("idx_subscribers_email", "subscriber_email"),
         Index("idx_subscribers_status", "status"),
+        # Active-count (company_id, status) and newest-first listing scans
+        Index("ix_sub_company_status_created", "company_id", "status", text("created_at DESC")),
+        # Newest-first listing and keyset pagination over (created_at, id)
+        Index("ix_sub_company_created_id", "company_id", text("created_at DESC"), text("id DESC")),
+        # Substring search in list_subscribers (LIKE '%...%')
+        Index(
+            "ix_sub_email_trgm",
+            "subscriber_email",
+            postgresql_using="gin",
+            postgresql_ops={"subscriber_email": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -5,20 +5,102 @@ These routes are PUBLIC - no authentication required.
 They handle newsletter subscriptions from company websites.
 """
 
+import base64
+import datetime
+import re
+import uuid
+from typing import Optional
 from fastapi import APIRouter, Depends, Header, HTTPException, status, BackgroundTasks, Query
-from sqlalchemy.orm import Session
-from loguru import logger
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import any_, bindparam, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.database import get_db
+from app.database.database import get_async_db
+from app.middlewares.rate_limit import TokenBucketLimiter
+from app.utils.constants import PUBLIC_SUBSCRIPTION_RATE_LIMIT
+from app.modules.auth.model import Company
+from app.modules.auth.routes import get_current_company
+from app.modules.subscribers.model import Subscriber
 from app.modules.subscribers.service import SubscriptionService
 from app.modules.subscribers.schemas import (
     SubscribeRequest,
     SubscribeResponse,
     UnsubscribeRequest,
     UnsubscribeResponse,
+    BulkDeleteRequest,
+)
+
+
+# Shared HTTP exceptions (as in app.utils.exceptions); raised as-is, never mutated
+invalid_company_id_exception = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid company ID format"
+)
+invalid_subscriber_id_exception = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid subscriber ID"
+)
+company_not_found_exception = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="Company not found"
+)
+subscriber_not_found_exception = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="Subscriber not found"
+)
+subscription_failed_exception = HTTPException(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="Failed to process subscription"
+)
+unsubscription_failed_exception = HTTPException(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="Failed to process unsubscription"
+)
+invalid_cursor_exception = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid cursor"
+)
+
+
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE
+)
+
+
+def parse_uuid(value: str, error: HTTPException = invalid_company_id_exception) -> uuid.UUID:
+    """Parse a canonical UUID path parameter, raising `error` (400) for anything else"""
+    if not _UUID_RE.match(value):
+        raise error
+    return uuid.UUID(value)
+
+
+def encode_cursor(created_at: datetime.datetime, subscriber_id: uuid.UUID) -> str:
+    """Opaque keyset cursor for the row after which the next page starts"""
+    raw = f"{created_at.isoformat()}|{subscriber_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime.datetime, uuid.UUID]:
+    """Decode a cursor from encode_cursor, raising 400 if it is malformed"""
+    try:
+        created_at, _, subscriber_id = base64.urlsafe_b64decode(cursor).decode().partition("|")
+        return datetime.datetime.fromisoformat(created_at), uuid.UUID(subscriber_id)
+    except ValueError:
+        raise invalid_cursor_exception
+
+
+# Built once; executed with per-request parameters
+_ACTIVE_SUBSCRIBER_COUNT = select(func.count()).select_from(Subscriber).where(
+    Subscriber.company_id == bindparam("cid"),
+    Subscriber.status == "subscribed"
 )
 
 
+# Shed bursts before a database connection is taken
+subscription_rate_limiter = TokenBucketLimiter(rate=PUBLIC_SUBSCRIPTION_RATE_LIMIT, period=60)
+
+
 # Public router (no authentication)
 public_router = APIRouter(
     prefix="/public",
@@ -31,6 +113,7 @@ public_router = APIRouter(
     response_model=SubscribeResponse,
     response_model_exclude_none=True,
     status_code=200,
+    dependencies=[Depends(subscription_rate_limiter)],
     summary="Subscribe to company newsletter",
     description="Public endpoint for newsletter subscriptions. No authentication required. "
                 "Origin header is validated against company website URL.",
@@ -39,7 +122,7 @@ async def subscribe_to_newsletter(
     company_id: str,
     request: SubscribeRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     origin: str = Header(None, description="Request Origin header")
 ) -> SubscribeResponse:
     """
@@ -57,6 +140,7 @@ async def subscribe_to_newsletter(
     - 400: Invalid input
     - 404: Company not found
     - 403: Origin not allowed or limit reached
+    - 429: Too many requests from this client
     
     **Example:**
     ```
@@ -70,18 +154,11 @@ async def subscribe_to_newsletter(
     ```
     """
     # Validate company_id format
-    try:
-        import uuid
-        uuid.UUID(company_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid company ID format"
-        )
+    company_uuid = parse_uuid(company_id)
     
     # Call subscription service
     success, response = await SubscriptionService.subscribe(
-        company_id=company_id,
+        company_id=company_uuid,
         email=request.email,
         origin=origin,
         db=db,
@@ -120,13 +197,11 @@ async def subscribe_to_newsletter(
                 )
         
         # Success case
-        return SubscribeResponse(**response)
+        # Built by the service; skip re-validating it
+        return SubscribeResponse.model_construct(**response)
     else:
         # Service error
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process subscription"
-        )
+        raise subscription_failed_exception
 
 
 @public_router.post(
@@ -134,6 +209,7 @@ async def subscribe_to_newsletter(
     response_model=UnsubscribeResponse,
     response_model_exclude_none=True,
     status_code=200,
+    dependencies=[Depends(subscription_rate_limiter)],
     summary="Unsubscribe from company newsletter",
     description="Public endpoint for newsletter unsubscriptions. No authentication required.",
 )
@@ -141,7 +217,7 @@ async def unsubscribe_from_newsletter(
     company_id: str,
     request: UnsubscribeRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> UnsubscribeResponse:
     """
     Unsubscribe an email from a company's newsletter.
@@ -164,18 +240,11 @@ async def unsubscribe_from_newsletter(
     ```
     """
     # Validate company_id format
-    try:
-        import uuid
-        uuid.UUID(company_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid company ID format"
-        )
+    company_uuid = parse_uuid(company_id)
     
     # Call subscription service
-    success, response = SubscriptionService.unsubscribe(
-        company_id=company_id,
+    success, response = await SubscriptionService.unsubscribe(
+        company_id=company_uuid,
         email=request.email,
         db=db,
         background_tasks=background_tasks
@@ -190,19 +259,14 @@ async def unsubscribe_from_newsletter(
             )
         
         # Success case
-        return UnsubscribeResponse(**response)
+        return UnsubscribeResponse.model_construct(**response)
     else:
         # Service error
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to process unsubscription"
-        )
+        raise unsubscription_failed_exception
 
 
 # ==================== PROTECTED ROUTES (Company Access) ====================
 
-from app.modules.auth.routes import get_current_company
-
 # Protected router for company-specific subscriber management
 protected_router = APIRouter(
     prefix="/api/subscribers",
@@ -212,14 +276,15 @@ protected_router = APIRouter(
 
 @protected_router.get(
     "/stats",
+    response_model=None,
     status_code=200,
     summary="Get subscriber statistics",
     description="Get subscriber count and statistics for the authenticated company."
 )
 async def get_subscriber_stats(
-    company_id: str = Depends(get_current_company),
-    db: Session = Depends(get_db)
-):
+    company_id: uuid.UUID = Depends(get_current_company),
+    db: AsyncSession = Depends(get_async_db)
+) -> dict:
     """
     Get subscriber statistics for the company.
     
@@ -229,53 +294,29 @@ async def get_subscriber_stats(
     - Subscription tier
     - Max subscribers allowed
     """
-    from app.modules.auth.model import Company
-    import uuid
+    company = await db.get(Company, company_id)
     
-    try:
-        company = db.query(Company).filter(
-            Company.id == uuid.UUID(company_id)
-        ).first()
-        
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Company not found"
-            )
-        
-        # Count active subscribers
-        from app.modules.subscribers.model import Subscriber
-        active_count = db.query(Subscriber).filter(
-            Subscriber.company_id == uuid.UUID(company_id),
-            Subscriber.status == "subscribed"
-        ).count()
-        
-        return {
-            "company_id": str(company.id),
-            "company_name": company.company_name,
-            "total_subscribers": company.subscriber_count,
-            "active_subscribers": active_count,
-            "subscription_tier": company.subscription_tier,
-            "is_premium": company.is_premium,
-            "max_subscribers": company.max_subscribers,
-            "percentage_used": round((company.subscriber_count / company.max_subscribers * 100), 2) if company.max_subscribers > 0 else 0
-        }
-        
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid company ID"
-        )
-    except Exception as e:
-        logger.error(f"Error fetching subscriber stats: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch subscriber statistics"
-        )
+    if not company:
+        raise company_not_found_exception
+    
+    # Count active subscribers
+    active_count = await db.scalar(_ACTIVE_SUBSCRIBER_COUNT, {"cid": company_id})
+    
+    return {
+        "company_id": str(company.id),
+        "company_name": company.company_name,
+        "total_subscribers": company.subscriber_count,
+        "active_subscribers": active_count,
+        "subscription_tier": company.subscription_tier,
+        "is_premium": company.is_premium,
+        "max_subscribers": company.max_subscribers,
+        "percentage_used": round((company.subscriber_count / company.max_subscribers * 100), 2) if company.max_subscribers > 0 else 0
+    }
 
 
 @protected_router.get(
     "",
+    response_model=None,
     status_code=200,
     summary="List company subscribers",
     description="Get paginated list of subscribers for the authenticated company with optional search"
@@ -284,9 +325,10 @@ async def list_subscribers(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     email: str = Query(None),
-    company_id: str = Depends(get_current_company),
-    db: Session = Depends(get_db)
-):
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    company_id: uuid.UUID = Depends(get_current_company),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """
     List all subscribers for a company with pagination and optional search.
     
@@ -294,81 +336,107 @@ async def list_subscribers(
     - page: Page number (default: 1)
     - limit: Items per page (default: 20, max: 100)
     - email: Optional email search filter
+    - cursor: Keyset cursor; when given, page is ignored and each page is a
+      single index seek no matter how deep
     
     Returns:
     - subscribers: List of subscriber objects
-    - total: Total subscriber count
-    - page: Current page number
+    - total: Total subscriber count (null on cursor pages; keep the first page's)
+    - page: Current page number (null on cursor pages)
     - page_size: Items per page
+    - next_cursor: Cursor for the next page, or null on the last page
     """
-    from app.modules.subscribers.model import Subscriber
-    import uuid
+    after = decode_cursor(cursor) if cursor else None
     
-    try:
-        # Validate pagination
-        page = max(1, page)
-        limit = min(100, max(1, limit))
-        skip = (page - 1) * limit
-        
-        # Build query
-        query = db.query(Subscriber).filter(
-            Subscriber.company_id == uuid.UUID(company_id)
+    # Validate pagination
+    page = max(1, page)
+    limit = min(100, max(1, limit))
+    skip = (page - 1) * limit
+    
+    # Build query
+    filters = [Subscriber.company_id == company_id]
+    
+    # Apply email filter if provided; stored emails are already lowercase
+    if email:
+        filters.append(
+            Subscriber.subscriber_email.like(f"%{email.lower()}%")
         )
-        
-        # Apply email filter if provided
-        if email:
-            query = query.filter(
-                Subscriber.subscriber_email.ilike(f"%{email}%")
-            )
-        
-        # Get total count
-        total = query.count()
-        
-        # Get paginated results
-        subscribers = query.order_by(
-            Subscriber.created_at.desc()
-        ).offset(skip).limit(limit).all()
-        
-        return {
-            "subscribers": [
-                {
-                    "id": str(sub.id),
-                    "email": sub.subscriber_email,
-                    "is_subscribed": sub.status == "subscribed",
-                    "subscribed_at": sub.created_at.isoformat(),
-                    "unsubscribed_at": None  # Could add unsubscribe timestamp if needed
-                }
-                for sub in subscribers
-            ],
-            "total": total,
-            "page": page,
-            "page_size": limit
-        }
     
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid company ID"
+    # Plain columns, no ORM instances; (created_at, id) is a total order
+    columns = [
+        Subscriber.id,
+        Subscriber.subscriber_email,
+        Subscriber.status,
+        Subscriber.created_at,
+    ]
+    order_by = (Subscriber.created_at.desc(), Subscriber.id.desc())
+    
+    if after:
+        # Keyset page: one extra row tells whether another page follows
+        result = await db.execute(
+            select(*columns).where(
+                *filters,
+                tuple_(Subscriber.created_at, Subscriber.id) < tuple_(*after)
+            ).order_by(*order_by).limit(limit + 1)
         )
-    except Exception as e:
-        logger.error(f"Error listing subscribers: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to list subscribers"
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        total = None
+        page = None
+    else:
+        # Page and total count in one round-trip
+        result = await db.execute(
+            select(*columns, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(*order_by)
+            .offset(skip)
+            .limit(limit)
         )
+        rows = result.all()
+    
+        # An empty page carries no window count; only page 1 can skip the fallback
+        if rows:
+            total = rows[0].total
+        elif skip:
+            total = await db.scalar(
+                select(func.count()).select_from(Subscriber).where(*filters)
+            )
+        else:
+            total = 0
+        has_more = skip + len(rows) < total
+    
+    # orjson serializes UUID and datetime natively (same text as str()/isoformat())
+    return ORJSONResponse({
+        "subscribers": [
+            {
+                "id": row.id,
+                "email": row.subscriber_email,
+                "is_subscribed": row.status == "subscribed",
+                "subscribed_at": row.created_at,
+                "unsubscribed_at": None  # Could add unsubscribe timestamp if needed
+            }
+            for row in rows
+        ],
+        "total": total,
+        "page": page,
+        "page_size": limit,
+        "next_cursor": encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    })
 
 
 @protected_router.delete(
     "/{subscriber_id}",
+    response_model=None,
     status_code=200,
     summary="Delete a subscriber",
     description="Delete a specific subscriber from the company's list"
 )
 async def delete_subscriber(
     subscriber_id: str,
-    company_id: str = Depends(get_current_company),
-    db: Session = Depends(get_db)
-):
+    company_id: uuid.UUID = Depends(get_current_company),
+    db: AsyncSession = Depends(get_async_db)
+) -> dict:
     """
     Delete a subscriber by ID.
     
@@ -378,42 +446,85 @@ async def delete_subscriber(
     Returns:
     - message: Success message
     """
-    from app.modules.subscribers.model import Subscriber
-    import uuid
+    subscriber_uuid = parse_uuid(subscriber_id, invalid_subscriber_id_exception)
     
-    try:
-        # Verify subscriber exists and belongs to the company
-        subscriber = db.query(Subscriber).filter(
-            Subscriber.id == uuid.UUID(subscriber_id),
-            Subscriber.company_id == uuid.UUID(company_id)
-        ).first()
-        
-        if not subscriber:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Subscriber not found"
-            )
-        
-        # Delete the subscriber
-        db.delete(subscriber)
-        db.commit()
-        
-        return {
-            "message": "Subscriber deleted successfully",
-            "subscriber_id": subscriber_id
-        }
+    # Verify subscriber exists and belongs to the company
+    result = await db.execute(
+        select(Subscriber).where(
+            Subscriber.id == subscriber_uuid,
+            Subscriber.company_id == company_id
+        )
+    )
+    subscriber = result.scalar_one_or_none()
     
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid subscriber ID or company ID"
+    if not subscriber:
+        raise subscriber_not_found_exception
+    
+    # Delete the subscriber
+    await db.delete(subscriber)
+    
+    # Same bookkeeping as bulk delete; unsubscribed rows were already
+    # taken off the count
+    if subscriber.status == "subscribed":
+        await db.execute(
+            update(Company)
+            .where(Company.id == company_id)
+            .values(subscriber_count=func.greatest(Company.subscriber_count - 1, 0))
+        )
+    
+    await db.commit()
+    
+    return {
+        "message": "Subscriber deleted successfully",
+        "subscriber_id": subscriber_id
+    }
+
+
+@protected_router.post(
+    "/bulk-delete",
+    response_model=None,
+    status_code=200,
+    summary="Delete several subscribers",
+    description="Delete a batch of subscribers from the company's list in one request"
+)
+async def bulk_delete_subscribers(
+    request: BulkDeleteRequest,
+    company_id: uuid.UUID = Depends(get_current_company),
+    db: AsyncSession = Depends(get_async_db)
+) -> dict:
+    """
+    Delete subscribers by ID in a single statement.
+    
+    IDs that don't exist or belong to another company are skipped.
+    
+    Returns:
+    - deleted: IDs that were deleted
+    """
+    result = await db.execute(
+        delete(Subscriber)
+        .where(
+            Subscriber.company_id == company_id,
+            # One array parameter keeps a single statement shape for any batch size
+            Subscriber.id == any_(
+                bindparam("ids", request.ids, type_=ARRAY(UUID(as_uuid=True)))
+            )
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting subscriber: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete subscriber"
+        .returning(Subscriber.id, Subscriber.status)
+    )
+    deleted = result.all()
+    
+    # Unsubscribed rows were already taken off the count
+    removed = sum(1 for row in deleted if row.status == "subscribed")
+    if removed:
+        await db.execute(
+            update(Company)
+            .where(Company.id == company_id)
+            .values(subscriber_count=func.greatest(Company.subscriber_count - removed, 0))
         )
+    
+    await db.commit()
+    
+    return {
+        "message": f"Deleted {len(deleted)} subscribers",
+        "deleted": [str(row.id) for row in deleted]
+    }
@@ -2,13 +2,31 @@
 Pydantic schemas for subscription endpoints.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+import re
+import uuid
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 
+# RFC-lite check; cheaper than EmailStr's email_validator on public endpoints
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _normalize_email(value: str) -> str:
+    """Trim and lowercase an email, rejecting obviously malformed ones"""
+    value = value.strip().lower()
+    if len(value) > 255 or not _EMAIL_RE.match(value):
+        raise ValueError("invalid email")
+    return value
+
 
 class SubscribeRequest(BaseModel):
     """Request to subscribe to newsletter."""
-    email: EmailStr = Field(..., description="Email to subscribe")
+    email: str = Field(..., description="Email to subscribe")
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return _normalize_email(value)
 
 
 class SubscribeResponse(BaseModel):
@@ -24,7 +42,12 @@ class SubscribeResponse(BaseModel):
 
 class UnsubscribeRequest(BaseModel):
     """Request to unsubscribe from newsletter."""
-    email: EmailStr = Field(..., description="Email to unsubscribe")
+    email: str = Field(..., description="Email to unsubscribe")
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return _normalize_email(value)
 
 
 class UnsubscribeResponse(BaseModel):
@@ -32,3 +55,8 @@ class UnsubscribeResponse(BaseModel):
     status: str = Field(..., description="Unsubscription status")
     message: str = Field(..., description="Human-readable message")
     code: Optional[str] = Field(None, description="Error code (if failed)")
+
+
+class BulkDeleteRequest(BaseModel):
+    """Request to delete several subscribers at once."""
+    ids: list[uuid.UUID] = Field(..., min_length=1, max_length=1000, description="Subscriber IDs to delete")
@@ -12,18 +12,73 @@ Handles:
 
 import re
 import uuid
-from typing import Tuple, Optional
-from urllib.parse import urlparse
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from typing import Awaitable, Callable, Tuple, Optional
+from sqlalchemy import or_, select, update, func, literal_column, bindparam
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 from fastapi import BackgroundTasks
 
 from app.modules.auth.model import Company
 from app.modules.subscribers.model import Subscriber
+from app.modules.subscribers.company_cache import CachedCompany, get_company_cached, extract_host
 from app.utils.mail.email_service import EmailService
 
 
+# Hot-path statements, built once and executed with per-request parameters
+_GET_SUBSCRIBER = select(Subscriber).where(
+    Subscriber.company_id == bindparam("cid"),
+    Subscriber.subscriber_email == bindparam("email")
+)
+
+_SUBSCRIBER_ID = select(Subscriber.id).where(
+    Subscriber.company_id == bindparam("cid"),
+    Subscriber.subscriber_email == bindparam("email")
+)
+
+_UPSERT_SUBSCRIBER = (
+    insert(Subscriber)
+    .values(
+        company_id=bindparam("cid"),
+        subscriber_email=bindparam("email"),
+        status="subscribed",
+        source_origin=bindparam("origin")
+    )
+    .on_conflict_do_update(
+        index_elements=[Subscriber.company_id, Subscriber.subscriber_email],
+        set_={
+            "status": "subscribed",
+            "source_origin": bindparam("origin"),
+            "updated_at": func.now()
+        },
+        where=Subscriber.status != "subscribed"
+    )
+    .returning(Subscriber.id, literal_column("xmax = 0").label("inserted"))
+)
+
+_SUBSCRIBER_COUNT = select(Company.subscriber_count).where(Company.id == bindparam("cid"))
+
+# Increments only while under the tier limit; returns no row once it is reached
+_CLAIM_SUBSCRIBER_SLOT = (
+    update(Company)
+    .where(
+        Company.id == bindparam("cid"),
+        or_(
+            Company.is_premium.is_(True),
+            Company.subscriber_count < Company.max_subscribers
+        )
+    )
+    .values(subscriber_count=Company.subscriber_count + 1)
+    .returning(Company.subscriber_count)
+)
+
+_RELEASE_SUBSCRIBER_SLOT = (
+    update(Company)
+    .where(Company.id == bindparam("cid"))
+    .values(subscriber_count=func.greatest(func.coalesce(Company.subscriber_count, 1) - 1, 0))
+)
+
+
 class SubscriptionService:
     """Service for managing public newsletter subscriptions."""
 
@@ -77,23 +132,13 @@ class SubscriptionService:
             Normalized domain (lowercase) or None if invalid
         """
         try:
-            if not url:
-                return None
-            
-            # Add scheme if missing
-            if not url.startswith(('http://', 'https://')):
-                url = f"https://{url}"
-            
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower() if parsed.netloc else None
-            
-            return domain
+            return extract_host(url)
         except Exception as e:
             logger.error(f"Failed to extract domain from {url}: {str(e)}")
             return None
 
     @staticmethod
-    def is_origin_allowed(origin: str, website_url: str) -> bool:
+    def is_origin_allowed(origin: str, allowed_hosts: frozenset[str]) -> bool:
         """
         Validate if request origin matches company website.
         
@@ -103,36 +148,61 @@ class SubscriptionService:
         
         Args:
             origin: Request Origin header (e.g., https://blog.example.com)
-            website_url: Company website URL from database
+            allowed_hosts: Precomputed company website hosts
             
         Returns:
             True if origin is allowed
         """
-        if not origin or not website_url:
+        if not origin or not allowed_hosts:
             return False
         
         origin_domain = SubscriptionService.extract_domain(origin)
-        website_domain = SubscriptionService.extract_domain(website_url)
         
-        if not origin_domain or not website_domain:
+        if not origin_domain:
             return False
         
-        # Exact match
-        if origin_domain == website_domain:
-            return True
-        
-        # Subdomain match: blog.example.com matches example.com
-        if origin_domain.endswith(f".{website_domain}"):
-            return True
+        # Exact match, then each parent domain: blog.example.com -> example.com -> com
+        host = origin_domain
+        while host:
+            if host in allowed_hosts:
+                return True
+            host = host.partition(".")[2]
         
         return False
 
+    @staticmethod
+    def _queue_email(
+        background_tasks: Optional[BackgroundTasks],
+        send_email: Callable[..., Awaitable[bool]],
+        email: str,
+        company: CachedCompany
+    ) -> None:
+        """
+        Schedule a subscriber notification to run after the response is sent.
+        
+        Only plain values are handed to the task: the request's database
+        session is closed by the time it runs.
+        
+        Args:
+            background_tasks: Request BackgroundTasks (no email if None)
+            send_email: EmailService coroutine to run
+            email: Subscriber email
+            company: Cached company snapshot
+        """
+        if background_tasks:
+            background_tasks.add_task(
+                send_email,
+                email,
+                company.company_name,
+                company.website_url
+            )
+
     @staticmethod
     async def subscribe(
-        company_id: str,
+        company_id: uuid.UUID,
         email: str,
         origin: Optional[str],
-        db: Session,
+        db: AsyncSession,
         background_tasks: Optional[BackgroundTasks] = None
     ) -> Tuple[bool, dict]:
         """
@@ -143,10 +213,9 @@ class SubscriptionService:
         2. Validate email format
         3. Check origin header against company website
         4. Normalize email
-        5. Check for existing subscription
-        6. Enforce tier limits
-        7. Insert subscriber (transactional)
-        8. Increment company subscriber_count (atomic)
+        5. Upsert subscriber (INSERT ... ON CONFLICT reactivates unsubscribed rows)
+        6. Enforce tier limits and increment company subscriber_count
+           (one conditional UPDATE, atomic with the insert or reactivation)
         
         Args:
             company_id: UUID of company
@@ -159,9 +228,7 @@ class SubscriptionService:
         """
         try:
             # Step 1: Validate and fetch company
-            company = db.query(Company).filter(
-                Company.id == uuid.UUID(company_id)
-            ).first()
+            company = await get_company_cached(company_id, db)
             
             if not company:
                 return False, {
@@ -188,7 +255,7 @@ class SubscriptionService:
             
             # Step 3: Origin validation
             if company.website_url and origin:
-                if not SubscriptionService.is_origin_allowed(origin, company.website_url):
+                if not SubscriptionService.is_origin_allowed(origin, company.allowed_hosts):
                     logger.warning(
                         f"Origin validation failed. Origin: {origin}, "
                         f"Company website: {company.website_url}"
@@ -202,101 +269,77 @@ class SubscriptionService:
             # Step 4: Normalize email
             normalized_email = SubscriptionService.normalize_email(email)
             
-            # Step 5: Check for existing subscription
-            existing = db.query(Subscriber).filter(
-                and_(
-                    Subscriber.company_id == uuid.UUID(company_id),
-                    Subscriber.subscriber_email == normalized_email
-                )
-            ).first()
-            
-            if existing:
-                if existing.status == "subscribed":
-                    # Already subscribed
-                    return True, {
-                        "status": "already_subscribed",
-                        "message": "Email already subscribed",
-                        "subscriber_id": str(existing.id),
-                        "email": normalized_email
-                    }
-                else:
-                    # Re-activate unsubscribed email
-                    existing.status = "subscribed"
-                    existing.source_origin = origin
-                    db.commit()
-                    
-                    # Send welcome email for resubscription
-                    if background_tasks:
-                        background_tasks.add_task(
-                            EmailService.send_subscription_welcome_email,
-                            normalized_email,
-                            company.company_name,
-                            company.website_url
-                        )
-                    
-                    return True, {
-                        "status": "resubscribed",
-                        "message": "Successfully resubscribed",
-                        "subscriber_id": str(existing.id),
-                        "email": normalized_email
-                    }
+            # Step 5: Insert, or reactivate an unsubscribed row, in one statement.
+            # An already-subscribed row fails the WHERE and returns nothing.
+            params = {"cid": company_id, "email": normalized_email, "origin": origin}
+            row = (await db.execute(_UPSERT_SUBSCRIBER, params)).first()
             
-            # Step 6: Enforce free tier limits
-            if not company.is_premium:
-                if company.subscriber_count >= company.max_subscribers:
-                    logger.warning(
-                        f"Free tier subscriber limit reached for company {company_id}. "
-                        f"Current: {company.subscriber_count}, Max: {company.max_subscribers}"
-                    )
-                    return False, {
-                        "status": "error",
-                        "code": "upgrade_required",
-                        "message": f"Subscriber limit reached ({company.max_subscribers}). Please upgrade to premium.",
-                        "max_subscribers": company.max_subscribers,
-                        "current_subscribers": company.subscriber_count
-                    }
-            
-            # Step 7: Create new subscription (transactional)
-            new_subscriber = Subscriber(
-                id=uuid.uuid4(),
-                company_id=uuid.UUID(company_id),
-                subscriber_email=normalized_email,
-                status="subscribed",
-                source_origin=origin
-            )
-            
-            db.add(new_subscriber)
+            if row is None:
+                # Already subscribed
+                await db.rollback()
+                subscriber_id = await db.scalar(_SUBSCRIBER_ID, params)
+                return True, {
+                    "status": "already_subscribed",
+                    "message": "Email already subscribed",
+                    "subscriber_id": str(subscriber_id),
+                    "email": normalized_email
+                }
             
-            # Step 8: Increment subscriber count atomically
-            company.subscriber_count = (company.subscriber_count or 0) + 1
+            # Step 6/7: Enforce free tier limits and increment subscriber count in
+            # one conditional UPDATE; no row back means the limit is reached.
+            # A reactivated row counts against the limit just like a new one.
+            total = await db.scalar(_CLAIM_SUBSCRIBER_SLOT, {"cid": company.id})
+            
+            if total is None:
+                # Undo the insert or status flip from step 5
+                await db.rollback()
+                subscriber_count = await db.scalar(_SUBSCRIBER_COUNT, {"cid": company.id})
+                logger.warning(
+                    f"Free tier subscriber limit reached for company {company_id}. "
+                    f"Current: {subscriber_count}, Max: {company.max_subscribers}"
+                )
+                return False, {
+                    "status": "error",
+                    "code": "upgrade_required",
+                    "message": f"Subscriber limit reached ({company.max_subscribers}). Please upgrade to premium.",
+                    "max_subscribers": company.max_subscribers,
+                    "current_subscribers": subscriber_count
+                }
             
             # Commit transaction
-            db.commit()
-            db.refresh(new_subscriber)
+            await db.commit()
+            
+            # Send welcome email in background (also on resubscription)
+            SubscriptionService._queue_email(
+                background_tasks,
+                EmailService.send_subscription_welcome_email,
+                normalized_email,
+                company
+            )
             
-            # Send welcome email in background
-            if background_tasks:
-                background_tasks.add_task(
-                    EmailService.send_subscription_welcome_email,
-                    normalized_email,
-                    company.company_name,
-                    company.website_url
-                )
+            if not row.inserted:
+                # Re-activated unsubscribed email
+                return True, {
+                    "status": "resubscribed",
+                    "message": "Successfully resubscribed",
+                    "subscriber_id": str(row.id),
+                    "email": normalized_email
+                }
             
             logger.info(
                 f"Subscription successful. Company: {company_id}, "
-                f"Email: {normalized_email}, Total: {company.subscriber_count}"
+                f"Email: {normalized_email}, Total: {total}"
             )
             
             return True, {
                 "status": "subscribed",
                 "message": "Successfully subscribed to newsletter",
-                "subscriber_id": str(new_subscriber.id),
+                "subscriber_id": str(row.id),
                 "email": normalized_email
             }
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Subscription error for company {company_id}: {str(e)}")
             return False, {
                 "status": "error",
@@ -305,10 +348,10 @@ class SubscriptionService:
             }
 
     @staticmethod
-    def unsubscribe(
-        company_id: str,
+    async def unsubscribe(
+        company_id: uuid.UUID,
         email: str,
-        db: Session,
+        db: AsyncSession,
         background_tasks: Optional[BackgroundTasks] = None
     ) -> Tuple[bool, dict]:
         """
@@ -326,12 +369,11 @@ class SubscriptionService:
         try:
             normalized_email = SubscriptionService.normalize_email(email)
             
-            subscriber = db.query(Subscriber).filter(
-                and_(
-                    Subscriber.company_id == uuid.UUID(company_id),
-                    Subscriber.subscriber_email == normalized_email
-                )
-            ).first()
+            result = await db.execute(
+                _GET_SUBSCRIBER,
+                {"cid": company_id, "email": normalized_email}
+            )
+            subscriber = result.scalar_one_or_none()
             
             if not subscriber:
                 return False, {
@@ -350,22 +392,20 @@ class SubscriptionService:
             subscriber.status = "unsubscribed"
             
             # Decrement subscriber count
-            company = db.query(Company).filter(
-                Company.id == uuid.UUID(company_id)
-            ).first()
+            company = await get_company_cached(company_id, db)
             
             if company:
-                company.subscriber_count = max(0, (company.subscriber_count or 1) - 1)
+                await db.execute(_RELEASE_SUBSCRIBER_SLOT, {"cid": company.id})
             
-            db.commit()
+            await db.commit()
             
             # Send unsubscribe confirmation email in background
-            if background_tasks and company:
-                background_tasks.add_task(
+            if company:
+                SubscriptionService._queue_email(
+                    background_tasks,
                     EmailService.send_unsubscribe_confirmation_email,
                     normalized_email,
-                    company.company_name,
-                    company.website_url
+                    company
                 )
             
             logger.info(
@@ -379,7 +419,7 @@ class SubscriptionService:
             }
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Unsubscription error for company {company_id}: {str(e)}")
             return False, {
                 "status": "error",
@@ -30,11 +30,11 @@ class CacheManager:
             self.redis = None
             logger.info("Redis connection closed.")
 
-    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+    async def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool:
         
         try:
-            await self.redis.set(key, value, ex=ex)
-            return True
+            # With nx=True redis returns None when the key already exists
+            return bool(await self.redis.set(key, value, ex=ex, nx=nx))
         except Exception as e:
             logger.error(f"Redis SET error: {str(e)}")
             return False
@@ -34,6 +34,16 @@ SQLALCHEMY_DATABASE_URL = (
     f"{os.getenv('DB_NAME')}"
 ) 
 
+# Same database through asyncpg, for AsyncSession routes
+ASYNC_SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace(
+    "postgresql+psycopg2://", "postgresql+asyncpg://", 1
+)
+
+# Sync engine pool. The defaults fit the API threadpool; Celery workers can
+# lower them, since each child process runs one task at a time
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+
 # ======================== REDIS CONFIGURATION ========================
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -52,6 +62,11 @@ MAIL_SMTP_PORT = int(os.getenv("MAIL_SMTP_PORT", 587))
 # ======================== RATE LIMITING CONFIGURATION ========================
 LOGIN_RATE_LIMIT_PERIOD = int(os.getenv("LOGIN_RATE_LIMIT_PERIOD", 60))
 PASSWORD_RATE_LIMIT_PERIOD = int(os.getenv("PASSWORD_RATE_LIMIT_PERIOD", 300))
+# Requests per minute per company + client IP. The IP is request.client.host,
+# so behind a load balancer the server must trust its X-Forwarded-For
+# (gunicorn --forwarded-allow-ips, set from FORWARDED_ALLOW_IPS in
+# docker-compose.prod.yml); otherwise every visitor shares the proxy's bucket
+PUBLIC_SUBSCRIPTION_RATE_LIMIT = int(os.getenv("PUBLIC_SUBSCRIPTION_RATE_LIMIT", 10))
 
 # ======================== RAZORPAY CONFIGURATION ========================
 RAZORPAY_KEY_ID = os.getenv("RAZORPAY_KEY_ID")
@@ -70,9 +85,17 @@ AWS_SES_ACCESS_KEY_ID = os.getenv("MAIL_USERNAME")
 AWS_SES_SECRET_ACCESS_KEY = os.getenv("MAIL_PASSWORD")
 AWS_SES_SENDER_EMAIL = os.getenv("MAIL_FROM")
 AWS_SES_CONFIGURATION_SET = os.getenv("AWS_SES_CONFIGURATION_SET", "skymail-events")
+# SQS queue subscribed to the configuration set's SNS event topic
+AWS_SES_EVENTS_QUEUE_URL = os.getenv("AWS_SES_EVENTS_QUEUE_URL")
+SES_EVENTS_POLL_INTERVAL_SECONDS = int(os.getenv("SES_EVENTS_POLL_INTERVAL_SECONDS", "30"))
+SES_EVENTS_MAX_RECEIVES_PER_RUN = int(os.getenv("SES_EVENTS_MAX_RECEIVES_PER_RUN", "50"))  # x10 messages
 
 # ======================== CAMPAIGN CONFIGURATION ========================
 CAMPAIGN_BATCH_SIZE = int(os.getenv("CAMPAIGN_BATCH_SIZE", "100"))
+CAMPAIGN_MAX_BATCH_SIZE = int(os.getenv("CAMPAIGN_MAX_BATCH_SIZE", "200"))  # recipients per send_campaign_batch task
 CAMPAIGN_SCHEDULER_INTERVAL_SECONDS = int(os.getenv("CAMPAIGN_SCHEDULER_INTERVAL_SECONDS", "60"))
-SES_SEND_RATE_LIMIT = int(os.getenv("SES_SEND_RATE_LIMIT", "14"))  # emails per second
+CAMPAIGN_SCHEDULER_MAX_PER_TICK = int(os.getenv("CAMPAIGN_SCHEDULER_MAX_PER_TICK", "1000"))
+CAMPAIGN_QUEUED_TIMEOUT_SECONDS = int(os.getenv("CAMPAIGN_QUEUED_TIMEOUT_SECONDS", "900"))
+SES_SEND_RATE_LIMIT = int(os.getenv("SES_SEND_RATE_LIMIT", "14"))  # emails per second per worker process (0 = no cap)
+SES_SEND_CONCURRENCY = int(os.getenv("SES_SEND_CONCURRENCY", "8"))  # parallel SES calls per batch
  
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""FastMail client that keeps its SMTP connection open between sends."""
+
+import asyncio
+from typing import Optional
+
+import aiosmtplib
+from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
+from fastapi_mail.errors import PydanticClassRequired
+from fastapi_mail.fastmail import email_dispatched
+from fastapi_mail.msg import MailMsg
+from loguru import logger
+
+from app.utils.mail.mail_config import mail_config
+
+
+class PersistentFastMail(FastMail):
+    """
+    FastMail that reuses one authenticated SMTP connection for every message.
+
+    Stock FastMail connects, negotiates TLS and logs in for each send, which
+    costs far more than sending a small OTP or welcome email. Sends are
+    serialized with a lock because an SMTP session carries one transaction at
+    a time. A connection the server has dropped is reopened on the next send.
+
+    Template rendering (template_name) is not supported; bodies are built
+    by the caller.
+    """
+
+    def __init__(self, config: ConnectionConfig) -> None:
+        super().__init__(config)
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.config.MAIL_SERVER,
+            port=self.config.MAIL_PORT,
+            timeout=self.config.TIMEOUT,
+            use_tls=self.config.MAIL_SSL_TLS,
+            start_tls=self.config.MAIL_STARTTLS,
+            validate_certs=self.config.VALIDATE_CERTS,
+        )
+        await smtp.connect()
+        if self.config.USE_CREDENTIALS:
+            await smtp.login(self.config.MAIL_USERNAME, self.config.MAIL_PASSWORD)
+        logger.debug("SMTP connection opened to {}", self.config.MAIL_SERVER)
+        return smtp
+
+    async def _send(self, msg) -> None:
+        if self._smtp is None or not self._smtp.is_connected:
+            self._smtp = await self._connect()
+        await self._smtp.send_message(msg)
+
+    def _discard(self) -> None:
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+
+    async def send_message(self, message: MessageSchema, template_name: Optional[str] = None) -> None:
+        if not isinstance(message, MessageSchema):
+            raise PydanticClassRequired(
+                "Message schema should be provided from MessageSchema class"
+            )
+
+        sender = self.config.MAIL_FROM
+        if self.config.MAIL_FROM_NAME is not None:
+            sender = f"{self.config.MAIL_FROM_NAME} <{self.config.MAIL_FROM}>"
+        msg = await MailMsg(message)._message(sender)
+
+        if not self.config.SUPPRESS_SEND:
+            async with self._lock:
+                try:
+                    try:
+                        await self._send(msg)
+                    except aiosmtplib.SMTPServerDisconnected:
+                        # Idle connection closed by the server; retry once on a new one
+                        self._smtp = None
+                        await self._send(msg)
+                except Exception:
+                    # Session state is unknown after a failed transaction
+                    self._discard()
+                    raise
+
+        email_dispatched.send(msg)
+
+    async def close(self) -> None:
+        """Close the SMTP connection (application shutdown)."""
+        async with self._lock:
+            if self._smtp is not None and self._smtp.is_connected:
+                try:
+                    await self._smtp.quit()
+                except aiosmtplib.SMTPException:
+                    pass
+            self._discard()
+
+
+mail_client = PersistentFastMail(mail_config)
@@ -0,0 +1,25 @@
+"""Time-ordered UUID (version 7) generation."""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7: 48-bit unix millisecond timestamp followed by random bits.
+
+    Successive values sort by creation time, so primary key inserts land on
+    the right edge of the B-tree instead of a random leaf.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+
+    # Version (0111) and RFC 4122 variant (10) bits
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62
+
+    return uuid.UUID(int=value)
@@ -1,28 +1,34 @@
 """Campaign scheduler task - runs every minute to enqueue due campaigns."""
 
-from sqlalchemy import select, and_, func
+from datetime import timedelta
+from sqlalchemy import select, update, and_, or_, func
 from loguru import logger
+from celery import group
 
-from app.celery_app import app
+from app.celery_app import TASK_PRIORITY_CAMPAIGN, TASK_PRIORITY_SCHEDULER, app
 from app.database.database import SessionLocal
 # Import all models with proper initialization order
 from app.database.models import Campaign
+from app.utils import constants
 from app.workers.campaign_send import send_campaign
 
+# A 'queued' campaign whose send task hasn't started by then is claimed again
+QUEUED_RECLAIM_AFTER = timedelta(seconds=constants.CAMPAIGN_QUEUED_TIMEOUT_SECONDS)
+
 
 @app.task(
     name="app.workers.campaign_scheduler.enqueue_due_campaigns",
     bind=True,
     queue="scheduled",
-    priority=10,
+    priority=TASK_PRIORITY_SCHEDULER,
     max_retries=3,
 )
 def enqueue_due_campaigns(self):
     """
     Scheduler task that runs every minute.
     
-    Fetches all campaigns with status='scheduled' and scheduled_for <= now()
-    Enqueues send_campaign task for each due campaign.
+    Claims campaigns with status='scheduled' and scheduled_for <= now()
+    by moving them to 'queued', then enqueues a send_campaign task for each.
     
     🧠 MENTAL MODEL:
     - Scheduler NEVER sends emails directly
@@ -30,59 +36,74 @@ def enqueue_due_campaigns(self):
     - Each campaign gets its own send task
     - PostgreSQL handles time comparisons, not Python
     """
-    db = SessionLocal()
     try:
-        logger.info("🔍 Checking for due campaigns...")
-        
-        # Query for campaigns that are scheduled and due
-        # Use func.now() so PostgreSQL does the time comparison
-        query = select(Campaign).where(
-            and_(
-                Campaign.status == "scheduled",
-                Campaign.scheduled_for <= func.now(),
+        # One transaction for the tick; committed (or rolled back) and the
+        # connection returned to the pool when the block exits
+        with SessionLocal.begin() as db:
+            logger.info("🔍 Checking for due campaigns...")
+            
+            # Claim due campaigns by flipping them to 'queued' in one statement.
+            # FOR UPDATE SKIP LOCKED lets a concurrent tick (or second beat)
+            # pass over rows this one is claiming, so each campaign is
+            # enqueued by exactly one scheduler. Campaigns stuck in 'queued'
+            # (e.g. the send task was lost) are reclaimed after a timeout.
+            # The due branch is served by the idx_campaign_due partial index;
+            # the limit keeps the first tick after an outage from enqueueing
+            # the whole backlog.
+            due = (
+                select(Campaign.id)
+                .where(
+                    or_(
+                        and_(
+                            Campaign.status == "scheduled",
+                            Campaign.scheduled_for <= func.now(),
+                        ),
+                        and_(
+                            Campaign.status == "queued",
+                            Campaign.updated_at < func.now() - QUEUED_RECLAIM_AFTER,
+                        ),
+                    )
+                )
+                .order_by(Campaign.scheduled_for)
+                .limit(constants.CAMPAIGN_SCHEDULER_MAX_PER_TICK)
+                .with_for_update(skip_locked=True)
             )
-        )
-        
-        due_campaigns = db.execute(query).scalars().all()
-        
-        if not due_campaigns:
-            logger.debug("✅ No campaigns due to send")
+            
+            claim = (
+                update(Campaign)
+                .where(Campaign.id.in_(due))
+                .values(status="queued", updated_at=func.now())
+                .returning(Campaign.id)
+            )
+            
+            due_campaign_ids = db.execute(claim).scalars().all()
+            
+            if not due_campaign_ids:
+                logger.debug("✅ No campaigns due to send")
+                return {
+                    "status": "success",
+                    "campaigns_enqueued": 0,
+                }
+            
+            logger.info(f"📨 Found {len(due_campaign_ids)} campaigns due to send")
+            
+            # Publish all sends as one group so they share a single producer and
+            # broker connection instead of one round-trip setup per campaign
+            group(
+                send_campaign.s(str(campaign_id)) for campaign_id in due_campaign_ids
+            ).apply_async(queue="campaigns", priority=TASK_PRIORITY_CAMPAIGN)
+            enqueued_count = len(due_campaign_ids)
+            
+            logger.info(f"✅ Enqueued {enqueued_count} campaigns")
+            
             return {
                 "status": "success",
-                "campaigns_enqueued": 0,
+                "campaigns_enqueued": enqueued_count,
+                "total_due": len(due_campaign_ids),
             }
-        
-        logger.info(f"📨 Found {len(due_campaigns)} campaigns due to send")
-        
-        enqueued_count = 0
-        for campaign in due_campaigns:
-            try:
-                # Enqueue the send_campaign task
-                send_campaign.apply_async(
-                    args=[str(campaign.id)],
-                    queue="campaigns",
-                    priority=10,
-                )
-                enqueued_count += 1
-                logger.info(
-                    f"✅ Enqueued campaign {campaign.id} "
-                    f"(Company: {campaign.company_id}, Name: {campaign.name})"
-                )
-            except Exception as e:
-                logger.error(
-                    f"❌ Failed to enqueue campaign {campaign.id}: {str(e)}"
-                )
-        
-        return {
-            "status": "success",
-            "campaigns_enqueued": enqueued_count,
-            "total_due": len(due_campaigns),
-        }
     
     except Exception as exc:
         logger.error(f"❌ Scheduler task failed: {str(exc)}", exc_info=True)
         # Retry with exponential backoff
         raise self.retry(exc=exc, countdown=60)  # Retry after 60 seconds
-    
-    finally:
-        db.close()
+
@@ -2,18 +2,18 @@
 
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import select, and_, update
+from sqlalchemy import select, and_, update, func
 from sqlalchemy.orm import Session
 from loguru import logger
+from celery import chord
 
-from app.celery_app import app
+from app.celery_app import TASK_PRIORITY_BATCH, app
 from app.database.database import SessionLocal
 # Import all models with proper initialization order
-from app.database.models import Campaign
+from app.database.models import Campaign, CampaignSendLog
 from app.modules.subscribers.model import Subscriber
-from app.modules.auth.model import Company
 from app.utils import constants
-from app.workers.email_batch import send_campaign_batch
+from app.workers.email_batch import get_campaign_content, send_campaign_batch
 
 
 @app.task(
@@ -46,7 +46,8 @@ def send_campaign(self, campaign_id: str):
         logger.info(f"🚀 Starting send_campaign for {campaign_id}")
         
         # ======================== PHASE 1: ACQUIRE LOCK ========================
-        # Update campaign status to 'sending' only if it's currently 'scheduled'
+        # Update campaign status to 'sending' only if it's currently 'queued'
+        # (claimed by the scheduler) or 'scheduled' (enqueued directly)
         # This is our distributed lock mechanism
         
         lock_query = (
@@ -54,7 +55,7 @@ def send_campaign(self, campaign_id: str):
             .where(
                 and_(
                     Campaign.id == campaign_id_obj,
-                    Campaign.status == "scheduled",
+                    Campaign.status.in_(("queued", "scheduled")),
                 )
             )
             .values(status="sending", updated_at=datetime.now(timezone.utc))
@@ -71,16 +72,22 @@ def send_campaign(self, campaign_id: str):
             return {
                 "status": "lock_failed",
                 "campaign_id": campaign_id,
-                "reason": "Campaign not in 'scheduled' status",
+                "reason": "Campaign not in 'queued' or 'scheduled' status",
             }
         
         logger.info(f"✅ Lock acquired for campaign {campaign_id}")
         
         # ======================== PHASE 2: FETCH CAMPAIGN ========================
         
+        # Core rows with only the columns used here; no ORM hydration
         campaign = db.execute(
-            select(Campaign).where(Campaign.id == campaign_id_obj)
-        ).scalar_one_or_none()
+            select(
+                Campaign.name,
+                Campaign.company_id,
+                Campaign.template_id,
+                Campaign.subject,
+            ).where(Campaign.id == campaign_id_obj)
+        ).one_or_none()
         
         if not campaign:
             logger.error(f"❌ Campaign {campaign_id} not found")
@@ -94,26 +101,28 @@ def send_campaign(self, campaign_id: str):
         
         # ======================== PHASE 3: FETCH SUBSCRIBERS IN BATCHES ========================
         
-        # Get company info for plan limit check
-        company = db.execute(
-            select(Company).where(Company.id == campaign.company_id)
-        ).scalar_one_or_none()
+        # Template, company and assets are loaded once here and handed to
+        # every batch, so batches don't query them again
+        content, error_reason = get_campaign_content(db, campaign_id_obj)
         
-        if not company:
-            logger.error(f"❌ Company {campaign.company_id} not found")
-            _mark_campaign_failed(db, campaign_id_obj, "Company not found")
-            return {"status": "error", "campaign_id": campaign_id, "reason": "company_not_found"}
+        if not content:
+            # A missing template or company won't come back on retry
+            _mark_campaign_cancelled(db, campaign_id_obj, error_reason)
+            return {"status": "error", "campaign_id": campaign_id, "reason": error_reason}
+        
+        content_json = content.to_json()
         
         # Fetch active subscribers
-        subscriber_query = select(Subscriber).where(
+        # Only the email column, streamed server-side so large lists aren't
+        # buffered twice (driver + ORM objects)
+        subscriber_query = select(Subscriber.subscriber_email).where(
             and_(
                 Subscriber.company_id == campaign.company_id,
                 Subscriber.status == "subscribed",
             )
-        )
+        ).execution_options(yield_per=5000)
         
-        all_subscribers = db.execute(subscriber_query).scalars().all()
-        subscriber_emails = [s.subscriber_email for s in all_subscribers]
+        subscriber_emails = list(db.execute(subscriber_query).scalars())
         
         logger.info(f"📊 Found {len(subscriber_emails)} active subscribers")
         
@@ -129,37 +138,29 @@ def send_campaign(self, campaign_id: str):
         
         # ======================== PHASE 4: ENQUEUE BATCH TASKS ========================
         
-        batch_size = constants.CAMPAIGN_BATCH_SIZE
-        batch_tasks = []
-        
-        for i in range(0, len(subscriber_emails), batch_size):
-            batch = subscriber_emails[i : i + batch_size]
-            batch_num = i // batch_size + 1
-            
-            # Enqueue batch send task
-            task = send_campaign_batch.apply_async(
-                args=[str(campaign_id), batch],
-                queue="email_batches",
-                priority=9,
-            )
-            batch_tasks.append(task)
-            
-            logger.info(
-                f"📨 Enqueued batch {batch_num} "
-                f"({len(batch)} emails) for campaign {campaign_id}"
-            )
+        batch_size = min(constants.CAMPAIGN_BATCH_SIZE, constants.CAMPAIGN_MAX_BATCH_SIZE)
+        batch_tasks = [
+            send_campaign_batch.s(
+                str(campaign_id),
+                subscriber_emails[i : i + batch_size],
+                content=content_json,
+            ).set(queue="email_batches", priority=TASK_PRIORITY_BATCH)
+            for i in range(0, len(subscriber_emails), batch_size)
+        ]
+        
+        # Publish all batches as one chord: the header group shares a single
+        # producer/connection, and the callback marks the campaign sent once
+        # every batch has finished. A batch that exhausts its retries runs
+        # the errback instead, so the campaign ends up 'failed' rather than
+        # stuck in 'sending'.
+        finalize = finalize_campaign.si(str(campaign_id))
+        chord(batch_tasks)(finalize.on_error(fail_campaign.si(str(campaign_id))))
         
         logger.info(
             f"✅ All {len(batch_tasks)} batches enqueued "
-            f"({len(subscriber_emails)} total emails)"
+            f"({len(subscriber_emails)} total emails, batch size {batch_size})"
         )
         
-        # ======================== PHASE 5: WAIT FOR COMPLETION ========================
-        # In production, we'd use a chord/group to track completion
-        # For now, mark as sent - send logs will track actual delivery
-        
-        _mark_campaign_sent(db, campaign_id_obj)
-        
         return {
             "status": "success",
             "campaign_id": campaign_id,
@@ -178,6 +179,71 @@ def send_campaign(self, campaign_id: str):
         db.close()
 
 
+@app.task(
+    name="app.workers.campaign_send.finalize_campaign",
+    queue="campaigns",
+    max_retries=3,
+    default_retry_delay=60,
+    autoretry_for=(Exception,),
+)
+def finalize_campaign(campaign_id: str):
+    """
+    Chord callback of send_campaign's batches.
+
+    Marks the campaign sent once all of its batches have finished.
+
+    Args:
+        campaign_id: UUID of campaign
+    """
+    with SessionLocal() as db:
+        _mark_campaign_sent(db, uuid.UUID(campaign_id))
+        return {"status": "success", "campaign_id": campaign_id}
+
+
+@app.task(
+    name="app.workers.campaign_send.fail_campaign",
+    queue="campaigns",
+    max_retries=3,
+    default_retry_delay=60,
+    autoretry_for=(Exception,),
+)
+def fail_campaign(campaign_id: str):
+    """
+    Chord errback of send_campaign's batches.
+
+    Runs when a batch exhausted its retries. Marks the campaign 'failed'
+    and records how many sends failed; the send logs of the batches that
+    did finish stay as they are.
+
+    Args:
+        campaign_id: UUID of campaign
+    """
+    campaign_id_obj = uuid.UUID(campaign_id)
+
+    with SessionLocal() as db:
+        failed_count = db.execute(
+            select(func.count()).where(
+                (CampaignSendLog.campaign_id == campaign_id_obj)
+                & (CampaignSendLog.status == "failed")
+            )
+        ).scalar_one()
+
+        now = datetime.now(timezone.utc)
+        db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id_obj)
+            .values(
+                status="failed",
+                cancel_reason=f"batch_failed ({failed_count} failed sends)",
+                updated_at=now,
+            )
+        )
+        db.commit()
+
+    logger.error(f"❌ Campaign {campaign_id} failed: a batch exhausted its retries")
+    return {"status": "failed", "campaign_id": campaign_id, "failed_count": failed_count}
+
+
 def _mark_campaign_sent(db: Session, campaign_id: uuid.UUID):
     """Mark campaign as sent."""
     now = datetime.now(timezone.utc)
@@ -190,6 +256,18 @@ def _mark_campaign_sent(db: Session, campaign_id: uuid.UUID):
     logger.info(f"✅ Campaign {campaign_id} marked as sent")
 
 
+def _mark_campaign_cancelled(db: Session, campaign_id: uuid.UUID, reason: str):
+    """Cancel a campaign that can never be sent, recording why."""
+    now = datetime.now(timezone.utc)
+    db.execute(
+        update(Campaign)
+        .where(Campaign.id == campaign_id)
+        .values(status="cancelled", cancel_reason=reason, updated_at=now)
+    )
+    db.commit()
+    logger.error(f"❌ Campaign {campaign_id} cancelled: {reason}")
+
+
 def _mark_campaign_failed(db: Session, campaign_id: uuid.UUID, error_msg: str):
     """Revert campaign to scheduled status (for retry) if it fails to enqueue batches."""
     now = datetime.now(timezone.utc)
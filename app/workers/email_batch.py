@@ -1,28 +1,325 @@
 """Email batch sending worker with AWS SES integration."""
 
 import boto3
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from typing import Optional
 import uuid
-from sqlalchemy import select, insert
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 from loguru import logger
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from celery import group
 
-from app.celery_app import app
+from app.celery_app import TASK_PRIORITY_BATCH, app
 from app.database.database import SessionLocal
 # Import all models with proper initialization order
 from app.database.models import Campaign, CampaignSendLog
+from app.modules.auth.model import Company
 from app.modules.newsletters.newsletter_templates.model import NewsletterTemplate
+from app.modules.newsletters.template_assets.model import TemplateAsset
+from app.modules.subscribers.model import Subscriber
 from app.utils import constants
 
 
-# Initialize SES client
+# Initialize SES client (thread-safe; one HTTP connection per concurrent call).
+# Adaptive retries back off on throttling before the batch has to retry;
+# keepalive stops idle pooled connections being dropped between batches.
 ses_client = boto3.client(
     "ses",
     region_name=constants.AWS_SES_REGION,
     aws_access_key_id=constants.AWS_SES_ACCESS_KEY_ID,
     aws_secret_access_key=constants.AWS_SES_SECRET_ACCESS_KEY,
+    config=Config(
+        max_pool_connections=constants.SES_SEND_CONCURRENCY,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+    ),
 )
 
+# SES calls are network-bound; a batch's chunks are sent in parallel.
+# Threads start lazily, so forked worker children each get their own.
+_ses_executor = ThreadPoolExecutor(
+    max_workers=constants.SES_SEND_CONCURRENCY,
+    thread_name_prefix="ses-send",
+)
+
+
+class _SendRateLimiter:
+    """
+    Thread-safe token bucket capping SES recipients per second.
+
+    acquire(n) reserves n tokens up front and sleeps off any deficit, so a
+    50-recipient chunk works with a bucket smaller than the chunk. The cap
+    is per worker process; set SES_SEND_RATE_LIMIT to the account's send
+    rate divided by the number of sending processes.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+_ses_rate_limiter = (
+    _SendRateLimiter(constants.SES_SEND_RATE_LIMIT)
+    if constants.SES_SEND_RATE_LIMIT > 0 else None
+)
+
+CAMPAIGN_CONTENT_CACHE_TTL_SECONDS = 60
+CAMPAIGN_CONTENT_CACHE_MAX_SIZE = 1_000
+
+# SendBulkTemplatedEmail accepts at most 50 destinations per call
+SES_MAX_DESTINATIONS = 50
+
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+# A placeholder, or any other "{{" that SES Handlebars would parse
+_SES_BRACES_RE = re.compile(r"\{\{(\w+)\}\}|\{\{")
+
+# Log statuses a recipient never gets resent from: delivered to SES, or
+# since bounced / complained about (set by process_ses_events)
+TERMINAL_SEND_STATUSES = ("sent", "bounced", "complained")
+
+# SES template names this process has already registered
+_registered_ses_templates: set[str] = set()
+
+# Superseded versions of a template are deleted once they are this old,
+# long after any batch still sending them has finished
+SES_TEMPLATE_RETENTION_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignContent:
+    """Snapshot of everything a batch needs to render a campaign"""
+    company_id: uuid.UUID
+    template_id: uuid.UUID
+    template_name: str
+    subject: str
+    html: str
+    company_name: str
+    website_url: str
+    # Comma-separated asset URLs for the {{template_asset}} placeholder
+    template_asset_urls: str
+    constants_values: dict
+
+    def to_json(self) -> dict:
+        """Task-argument form (tasks are JSON-serialized)"""
+        data = asdict(self)
+        data["company_id"] = str(self.company_id)
+        data["template_id"] = str(self.template_id)
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict) -> "CampaignContent":
+        return cls(**{
+            **data,
+            "company_id": uuid.UUID(data["company_id"]),
+            "template_id": uuid.UUID(data["template_id"]),
+        })
+
+
+# campaign_id -> (expires_at, snapshot)
+_campaign_content_cache: dict[uuid.UUID, tuple[float, CampaignContent]] = {}
+
+
+def get_campaign_content(
+    db: Session, campaign_id: uuid.UUID
+) -> tuple[Optional[CampaignContent], Optional[str]]:
+    """
+    Get a campaign's render data, loading it from the database on a miss.
+
+    A campaign's content is fixed once it is sending, so a short TTL only
+    bounds how long a template edited mid-send keeps its old version.
+
+    Args:
+        db: Database session used on a cache miss
+        campaign_id: Campaign UUID
+
+    Returns:
+        (content, None), or (None, error reason) if something is missing
+    """
+    now = time.monotonic()
+    entry = _campaign_content_cache.get(campaign_id)
+    if entry and entry[0] > now:
+        return entry[1], None
+
+    # Outer joins keep the campaign row when its template or company is gone,
+    # so each missing piece still gets its own error reason. Only the columns
+    # the content needs are selected.
+    row = db.execute(
+        select(
+            Campaign.template_id,
+            Campaign.company_id,
+            Campaign.subject,
+            Campaign.constants_values,
+            NewsletterTemplate.id.label("found_template_id"),
+            NewsletterTemplate.name.label("template_name"),
+            NewsletterTemplate.subject.label("template_subject"),
+            NewsletterTemplate.html_content,
+            Company.id.label("found_company_id"),
+            Company.company_name,
+            Company.website_url,
+        )
+        .outerjoin(NewsletterTemplate, NewsletterTemplate.id == Campaign.template_id)
+        .outerjoin(Company, Company.id == Campaign.company_id)
+        .where(Campaign.id == campaign_id)
+    ).one_or_none()
+    
+    if not row:
+        logger.error(f"❌ Campaign {campaign_id} not found")
+        return None, "campaign_not_found"
+    
+    if not row.found_template_id:
+        logger.error(f"❌ Template {row.template_id} not found")
+        return None, "template_not_found"
+    
+    if not row.found_company_id:
+        logger.error(f"❌ Company {row.company_id} not found")
+        return None, "company_not_found"
+    
+    # ======================== FETCH TEMPLATE ASSETS ========================
+    
+    asset_urls = db.execute(
+        select(TemplateAsset.file_url).where(
+            (TemplateAsset.template_id == row.template_id)
+            & (TemplateAsset.company_id == row.company_id)
+        )
+    ).scalars().all()
+    
+    logger.debug("📦 Found {} template assets", len(asset_urls))
+
+    content = CampaignContent(
+        company_id=row.company_id,
+        template_id=row.template_id,
+        template_name=row.template_name,
+        subject=row.subject or row.template_subject,
+        html=row.html_content,
+        company_name=row.company_name,
+        website_url=row.website_url or "",
+        template_asset_urls=",".join(asset_urls),
+        constants_values=row.constants_values or {},
+    )
+
+    if len(_campaign_content_cache) >= CAMPAIGN_CONTENT_CACHE_MAX_SIZE:
+        # Drop the oldest insertion
+        _campaign_content_cache.pop(next(iter(_campaign_content_cache)), None)
+    _campaign_content_cache[campaign_id] = (now + CAMPAIGN_CONTENT_CACHE_TTL_SECONDS, content)
+
+    return content, None
+
+
+def _to_ses_template(text: str) -> str:
+    """
+    Convert {{variable}} placeholders to SES Handlebars syntax.
+
+    Placeholders become triple-brace (unescaped) variables, since values
+    have always been substituted verbatim. Every other "{{" (spaced or
+    dotted names, inline JS/CSS) is escaped so SES prints it literally
+    instead of failing to render the message.
+
+    >>> _to_ses_template("Hi {{name}}")
+    'Hi {{{name}}}'
+    >>> _to_ses_template("<script>var t = '{{ user.name }}';</script>")
+    "<script>var t = '\\\\{{ user.name }}';</script>"
+    """
+    return _SES_BRACES_RE.sub(
+        lambda m: f"{{{{{{{m.group(1)}}}}}}}" if m.group(1) else "\\{{",
+        text,
+    )
+
+
+def _ensure_ses_template(template_id: uuid.UUID, subject: str, html: str) -> str:
+    """
+    Register campaign content as an SES template and return its name.
+
+    The name includes a hash of the content, so an edited template gets a
+    new SES template and existing ones never need updating. Registering a
+    new version prunes old versions of the same template so the account
+    stays under its SES template quota.
+
+    Args:
+        template_id: NewsletterTemplate UUID
+        subject: Subject line with {{variable}} placeholders
+        html: HTML body with {{variable}} placeholders
+
+    Returns:
+        SES template name
+    """
+    # The converted parts are hashed, so a change to the conversion rules
+    # registers fresh templates instead of reusing ones built the old way
+    subject_part = _to_ses_template(subject)
+    html_part = _to_ses_template(html)
+    digest = hashlib.sha256(f"{subject_part}\0{html_part}".encode()).hexdigest()[:16]
+    template_name = f"skymail-{template_id.hex}-{digest}"
+
+    if template_name in _registered_ses_templates:
+        return template_name
+
+    try:
+        ses_client.create_template(
+            Template={
+                "TemplateName": template_name,
+                "SubjectPart": subject_part,
+                "HtmlPart": html_part,
+            }
+        )
+        logger.info(f"📄 Registered SES template {template_name}")
+    except ClientError as e:
+        # Another worker registered it first
+        if e.response["Error"]["Code"] != "AlreadyExists":
+            raise
+    else:
+        _prune_ses_templates(template_id, keep=template_name)
+
+    _registered_ses_templates.add(template_name)
+    return template_name
+
+
+def _prune_ses_templates(template_id: uuid.UUID, keep: str):
+    """
+    Delete superseded SES versions of a newsletter template.
+
+    Only versions older than SES_TEMPLATE_RETENTION_SECONDS are removed; a
+    batch that still hits a deleted one re-registers it (see send_chunk).
+    Failures are logged and never block the send.
+    """
+    prefix = f"skymail-{template_id.hex}-"
+    cutoff = datetime.now(timezone.utc).timestamp() - SES_TEMPLATE_RETENTION_SECONDS
+
+    try:
+        for page in ses_client.get_paginator("list_templates").paginate():
+            for meta in page.get("TemplatesMetadata", []):
+                name = meta["Name"]
+                if (
+                    name.startswith(prefix)
+                    and name != keep
+                    and meta["CreatedTimestamp"].timestamp() < cutoff
+                ):
+                    ses_client.delete_template(TemplateName=name)
+                    _registered_ses_templates.discard(name)
+                    logger.info(f"🗑️ Deleted superseded SES template {name}")
+    except ClientError as e:
+        logger.warning(f"⚠️ Could not prune SES templates for {template_id}: {e}")
+
 
 @app.task(
     name="app.workers.email_batch.send_campaign_batch",
@@ -33,7 +330,12 @@ ses_client = boto3.client(
     autoretry_for=(Exception,),
     retry_backoff=True,
 )
-def send_campaign_batch(self, campaign_id: str, subscriber_emails: list):
+def send_campaign_batch(
+    self,
+    campaign_id: str,
+    subscriber_emails: list,
+    content: Optional[dict] = None,
+):
     """
     Send emails to a batch of subscribers using AWS SES.
     
@@ -41,8 +343,8 @@ def send_campaign_batch(self, campaign_id: str, subscriber_emails: list):
     Must NOT update campaign status. Campaign status is managed by send_campaign task.
     
     Responsibilities:
-    1. Render template with variables
-    2. Send via AWS SES
+    1. Register the template with SES (placeholders are rendered by SES)
+    2. Send via SES SendBulkTemplatedEmail, up to 50 recipients per call
     3. Log delivery status per email
     4. Handle SES errors (throttling, bounces, etc.)
     5. Track via CampaignSendLog for idempotency
@@ -50,7 +352,25 @@ def send_campaign_batch(self, campaign_id: str, subscriber_emails: list):
     Args:
         campaign_id: UUID of campaign
         subscriber_emails: List of email addresses to send to
+        content: CampaignContent.to_json() prefetched by send_campaign;
+            loaded (and cached) here when omitted
     """
+    max_batch = constants.CAMPAIGN_MAX_BATCH_SIZE
+    if len(subscriber_emails) > max_batch:
+        # Oversized batches (queued by hand or by an older producer) are
+        # split so no single task holds thousands of recipients; the group
+        # takes this task's place in a chord
+        logger.info(
+            f"✂️ Splitting {len(subscriber_emails)} emails into batches of {max_batch} "
+            f"(Campaign: {campaign_id})"
+        )
+        return self.replace(group(
+            send_campaign_batch.s(
+                campaign_id, subscriber_emails[i : i + max_batch], content=content
+            ).set(queue="email_batches", priority=TASK_PRIORITY_BATCH)
+            for i in range(0, len(subscriber_emails), max_batch)
+        ))
+
     db = SessionLocal()
     try:
         campaign_id_obj = uuid.UUID(campaign_id)
@@ -60,234 +380,276 @@ def send_campaign_batch(self, campaign_id: str, subscriber_emails: list):
             f"({len(subscriber_emails)} emails)"
         )
         
-        # ======================== FETCH CAMPAIGN & TEMPLATE ========================
-        
-        campaign = db.execute(
-            select(Campaign).where(Campaign.id == campaign_id_obj)
-        ).scalar_one_or_none()
-        
-        if not campaign:
-            logger.error(f"❌ Campaign {campaign_id} not found")
-            return {"status": "error", "reason": "campaign_not_found"}
-        
-        # Fetch template
-        template = None
-        if campaign.template_id:
-            template = db.execute(
-                select(NewsletterTemplate).where(
-                    NewsletterTemplate.id == campaign.template_id
-                )
-            ).scalar_one_or_none()
-        
-        if not template:
-            logger.error(f"❌ Template {campaign.template_id} not found")
-            return {"status": "error", "reason": "template_not_found"}
-        
-        logger.info(f"📄 Using template: {template.name}")
-        
-        # ======================== FETCH COMPANY DATA ========================
-        
-        from app.modules.auth.model import Company
+        # ======================== FETCH CAMPAIGN CONTENT ========================
+        # Normally passed in by send_campaign; otherwise cached per worker
+        # process so consecutive batches skip the campaign/template/company/
+        # asset SELECTs
         
-        company = db.execute(
-            select(Company).where(Company.id == campaign.company_id)
-        ).scalar_one_or_none()
+        if content:
+            content = CampaignContent.from_json(content)
+        else:
+            content, error_reason = get_campaign_content(db, campaign_id_obj)
+            if not content:
+                return {"status": "error", "reason": error_reason}
         
-        if not company:
-            logger.error(f"❌ Company {campaign.company_id} not found")
-            return {"status": "error", "reason": "company_not_found"}
-        
-        # ======================== FETCH TEMPLATE ASSETS ========================
-        
-        from app.modules.newsletters.template_assets.model import TemplateAsset
-        
-        template_assets = db.execute(
-            select(TemplateAsset).where(
-                (TemplateAsset.template_id == campaign.template_id)
-                & (TemplateAsset.company_id == campaign.company_id)
-            )
-        ).scalars().all()
-        
-        # Build template_asset string (comma-separated URLs)
-        template_asset_urls = ",".join([asset.file_url for asset in template_assets]) if template_assets else ""
-        
-        logger.debug(f"📦 Found {len(template_assets)} template assets")
+        logger.info(f"📄 Using template: {content.template_name}")
         
         # ======================== PREPARE EMAIL DETAILS ========================
         
         from_email = constants.AWS_SES_SENDER_EMAIL or constants.MAIL_FROM
-        campaign_subject = campaign.subject or template.subject
-        template_html = template.html_content
-        template_text = template.text_content
         
         if not from_email:
             logger.error("❌ AWS_SES_SENDER_EMAIL not configured")
             return {"status": "error", "reason": "sender_email_not_configured"}
         
-        # ======================== SEND EMAILS IN BATCH ========================
-        
-        sent_count = 0
+        # ======================== SKIP ALREADY-SENT EMAILS ========================
+        # One query for the whole batch instead of one per recipient
+
+        already_sent = set(
+            db.execute(
+                select(CampaignSendLog.subscriber_email).where(
+                    (CampaignSendLog.campaign_id == campaign_id_obj)
+                    & (CampaignSendLog.subscriber_email.in_(subscriber_emails))
+                    & (CampaignSendLog.status.in_(TERMINAL_SEND_STATUSES))
+                )
+            ).scalars()
+        )
+
+        # dict.fromkeys drops duplicates; one upsert can't touch a row twice
+        pending_emails = [
+            email for email in dict.fromkeys(subscriber_emails)
+            if email not in already_sent
+        ]
+
+        sent_count = len(subscriber_emails) - len(pending_emails)
         failed_count = 0
-        
-        for email in subscriber_emails:
-            try:
-                logger.debug(f"📤 Sending to {email}")
-                
-                # Check if already sent (idempotency)
-                existing_log = db.execute(
-                    select(CampaignSendLog).where(
-                        (CampaignSendLog.campaign_id == campaign_id_obj)
-                        & (CampaignSendLog.subscriber_email == email)
-                    )
-                ).scalar_one_or_none()
-                
-                if existing_log and existing_log.status == "sent":
-                    logger.debug(f"⏭️  Email already sent to {email}, skipping")
-                    sent_count += 1
-                    continue
-                
-                # ======================== FETCH SUBSCRIBER DATA ========================
-                
-                from app.modules.subscribers.model import Subscriber
-                
-                subscriber = db.execute(
-                    select(Subscriber).where(
-                        (Subscriber.company_id == campaign.company_id)
-                        & (Subscriber.subscriber_email == email)
-                    )
-                ).scalar_one_or_none()
-                
-                # ======================== BUILD RENDER CONTEXT ========================
-                # Merge system variables (from DB) + campaign constants (manual values) + template assets
-                
-                render_context = {
-                    # System variables (auto-resolved)
-                    "company_name": company.company_name,
-                    "website_url": company.website_url or "",
-                    "subscriber_email": email,
-                    "subscriber_username": subscriber.subscriber_name if subscriber else email.split("@")[0],
-                    "template_asset": template_asset_urls,
-                    # Campaign constants (manual values provided at creation)
-                    **(campaign.constants_values or {})
+
+        if sent_count:
+            logger.debug("⏭️  {} emails already sent, skipping", sent_count)
+
+        # ======================== FETCH SUBSCRIBER DATA ========================
+
+        subscriber_names = dict(
+            db.execute(
+                select(Subscriber.subscriber_email, Subscriber.subscriber_name).where(
+                    (Subscriber.company_id == content.company_id)
+                    & (Subscriber.subscriber_email.in_(pending_emails))
+                )
+            ).all()
+        ) if pending_emails else {}
+
+        # End the read transaction so the pooled connection isn't held while
+        # SES calls are in flight; each log upsert below checks one out briefly
+        db.commit()
+
+        # ======================== BUILD RENDER CONTEXT ========================
+        # Merge system variables (from DB) + campaign constants (manual values) + template assets
+
+        # Everything except the subscriber fields is the same for the whole batch
+        base_context = {
+            key: str(value)
+            for key, value in {
+                # System variables (auto-resolved)
+                "company_name": content.company_name,
+                "website_url": content.website_url,
+                "template_asset": content.template_asset_urls,
+                # Campaign constants (manual values provided at creation)
+                **content.constants_values
+            }.items()
+        }
+
+        def render_context(email: str) -> dict:
+            # Campaign constants still win over the subscriber fields
+            return {
+                "subscriber_email": email,
+                "subscriber_username": subscriber_names.get(email) or email.split("@")[0],
+                **base_context,
+            }
+
+        # Every recipient gets the same keys, so one check covers the batch.
+        # SES drops a message whose template references a missing variable,
+        # so unresolved placeholders are sent as their literal text instead
+        unresolved = (
+            set(_PLACEHOLDER_RE.findall(content.subject))
+            | set(_PLACEHOLDER_RE.findall(content.html))
+        ) - render_context("").keys()
+        if unresolved:
+            logger.warning(f"⚠️ Unresolved variables in template: {sorted(unresolved)}")
+            base_context.update({name: f"{{{{{name}}}}}" for name in unresolved})
+
+        # ======================== SEND EMAILS IN BATCH ========================
+        # SES renders the placeholders itself; one SendBulkTemplatedEmail call
+        # covers up to SES_MAX_DESTINATIONS recipients
+
+        ses_template_name = _ensure_ses_template(content.template_id, content.subject, content.html)
+        # Shared by every log row of the batch; serialized on insert, never mutated
+        batch_meta = {"batch_size": len(subscriber_emails)}
+        send_logs: list[dict] = []
+
+        # The configuration set publishes bounce, complaint and rendering-
+        # failure events, which process_ses_events applies to the logs below
+        send_options = (
+            {"ConfigurationSetName": constants.AWS_SES_CONFIGURATION_SET}
+            if constants.AWS_SES_CONFIGURATION_SET else {}
+        )
+
+        def send_chunk(chunk: list[str]) -> dict:
+            if _ses_rate_limiter:
+                _ses_rate_limiter.acquire(len(chunk))
+            destinations = [
+                {
+                    "Destination": {"ToAddresses": [email]},
+                    "ReplacementTemplateData": json.dumps(render_context(email)),
                 }
-                
-                logger.debug(f"🔍 Render context: {render_context}")
-                
-                # ======================== RENDER TEMPLATE ========================
-                
-                rendered_subject = campaign_subject
-                rendered_html = template_html
-                rendered_text = template_text if template_text else ""
-                
-                # Replace all {{variable_name}} placeholders
-                for key, value in render_context.items():
-                    placeholder = f"{{{{{key}}}}}"
-                    rendered_subject = rendered_subject.replace(placeholder, str(value))
-                    rendered_html = rendered_html.replace(placeholder, str(value))
-                    rendered_text = rendered_text.replace(placeholder, str(value))
-                
-                # Check for unresolved variables
-                import re
-                unresolved = re.findall(r"\{\{(\w+)\}\}", rendered_html)
-                if unresolved:
-                    logger.warning(f"⚠️ Unresolved variables in template: {unresolved}")
-                
-                logger.info(f"✅ Template rendered for {email}")
-                
-                # Create or update send log
-                send_log_id = existing_log.id if existing_log else uuid.uuid4()
-                
-                # Send via SES
-                response = ses_client.send_email(
+                for email in chunk
+            ]
+            try:
+                return ses_client.send_bulk_templated_email(
                     Source=from_email,
-                    Destination={"ToAddresses": [email]},
-                    Message={
-                        "Subject": {"Data": rendered_subject, "Charset": "UTF-8"},
-                        "Body": {
-                            "Html": {"Data": rendered_html, "Charset": "UTF-8"},
-                        },
-                    },
+                    Template=ses_template_name,
+                    DefaultTemplateData="{}",
+                    **send_options,
+                    Destinations=destinations,
                 )
-                
-                ses_message_id = response["MessageId"]
-                
-                logger.debug(f"✅ Email sent to {email} (SES ID: {ses_message_id})")
-                
-                # Create or update send log
-                if existing_log:
-                    # Update existing log
-                    existing_log.status = "sent"
-                    existing_log.ses_message_id = ses_message_id
-                    existing_log.sent_at = datetime.now(timezone.utc)
-                    existing_log.error_message = None
-                    db.merge(existing_log)
-                else:
-                    # Create new log
-                    send_log = CampaignSendLog(
-                        id=send_log_id,
-                        campaign_id=campaign_id_obj,
-                        subscriber_email=email,
-                        ses_message_id=ses_message_id,
-                        status="sent",
-                        sent_at=datetime.now(timezone.utc),
-                        metadata={"batch_size": len(subscriber_emails)},
-                    )
-                    db.add(send_log)
-                
-                sent_count += 1
-            
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "TemplateDoesNotExist":
+                    raise
+                # Pruned by another worker while this campaign was sending
+                _registered_ses_templates.discard(ses_template_name)
+                _ensure_ses_template(content.template_id, content.subject, content.html)
+                return ses_client.send_bulk_templated_email(
+                    Source=from_email,
+                    Template=ses_template_name,
+                    DefaultTemplateData="{}",
+                    **send_options,
+                    Destinations=destinations,
+                )
+
+        # SES calls run concurrently on the shared pool; results are handled
+        # here as each chunk completes, so all DB work stays on this thread
+        # and overlaps with the sends still in flight
+        futures = {
+            _ses_executor.submit(send_chunk, chunk): chunk
+            for chunk in (
+                pending_emails[i : i + SES_MAX_DESTINATIONS]
+                for i in range(0, len(pending_emails), SES_MAX_DESTINATIONS)
+            )
+        }
+        throttled = False
+        # One timestamp for the batch's sent_at values
+        sent_at = datetime.now(timezone.utc)
+
+        def record(chunk: list[str], future) -> None:
+            """Turn one chunk's SES result into send log rows."""
+            nonlocal sent_count, failed_count, throttled
+
+            try:
+                response = future.result()
+
             except ClientError as ses_error:
                 error_code = ses_error.response["Error"]["Code"]
                 error_msg = ses_error.response["Error"]["Message"]
-                
-                logger.error(f"❌ SES error for {email}: {error_code} - {error_msg}")
-                
-                # Update or create send log with error
-                if existing_log:
-                    existing_log.status = "failed"
-                    existing_log.error_message = f"{error_code}: {error_msg}"
-                    db.merge(existing_log)
-                else:
-                    send_log = CampaignSendLog(
-                        id=uuid.uuid4(),
-                        campaign_id=campaign_id_obj,
-                        subscriber_email=email,
-                        status="failed",
+
+                if error_code == "Throttling":
+                    # Left unlogged so the retry sends them
+                    throttled = True
+                    return
+
+                logger.error(f"❌ SES error for {len(chunk)} emails: {error_code} - {error_msg}")
+
+                chunk_meta = {**batch_meta, "error_code": error_code}
+                send_logs.extend(
+                    _send_log_row(
+                        campaign_id_obj, email, "failed",
                         error_message=f"{error_code}: {error_msg}",
-                        metadata={
-                            "error_code": error_code,
-                            "batch_size": len(subscriber_emails),
-                        },
+                        extra_data=chunk_meta,
                     )
-                    db.add(send_log)
-                
-                failed_count += 1
-                
-                # Handle specific SES errors
+                    for email in chunk
+                )
+                failed_count += len(chunk)
+                return
+
+            except Exception as exc:
+                logger.error(f"❌ Unexpected error sending {len(chunk)} emails: {str(exc)}")
+
+                send_logs.extend(
+                    _send_log_row(
+                        campaign_id_obj, email, "failed",
+                        error_message=str(exc),
+                        extra_data=batch_meta,
+                    )
+                    for email in chunk
+                )
+                failed_count += len(chunk)
+                return
+
+            # Status entries come back in Destinations order
+            for email, result in zip(chunk, response["Status"]):
+                if result["Status"] == "Success":
+                    send_logs.append(_send_log_row(
+                        campaign_id_obj, email, "sent",
+                        ses_message_id=result["MessageId"],
+                        sent_at=sent_at,
+                        extra_data=batch_meta,
+                    ))
+                    sent_count += 1
+                    continue
+
+                error_code = result["Status"]
+                error_msg = result.get("Error", "")
+
+                logger.error(f"❌ SES error for {email}: {error_code} - {error_msg}")
                 if error_code == "MessageRejected":
                     logger.warning(f"⚠️ Message rejected for {email}, skipping")
-                elif error_code == "Throttling":
-                    logger.warning(f"⏱️ SES throttled, retrying batch in 30 seconds")
+
+                send_logs.append(_send_log_row(
+                    campaign_id_obj, email, "failed",
+                    error_message=f"{error_code}: {error_msg}",
+                    extra_data={**batch_meta, "error_code": error_code},
+                ))
+                failed_count += 1
+
+        handled = set()
+        try:
+            for future in as_completed(futures):
+                # Commit the logs of chunks handled so far, so a crash or retry
+                # mid-batch doesn't resend recipients SES accepted
+                if send_logs:
+                    _write_send_logs(db, send_logs)
                     db.commit()
-                    raise self.retry(countdown=30)
-            
-            except Exception as exc:
-                logger.error(f"❌ Unexpected error sending to {email}: {str(exc)}")
-                
-                # Create send log for failed email
-                send_log = CampaignSendLog(
-                    id=uuid.uuid4(),
-                    campaign_id=campaign_id_obj,
-                    subscriber_email=email,
-                    status="failed",
-                    error_message=str(exc),
-                    metadata={"batch_size": len(subscriber_emails)},
+
+                handled.add(future)
+                record(futures[future], future)
+
+        except Exception:
+            # The task is about to retry: stop chunks that haven't started and
+            # record the ones already in flight, or the retry sends them twice
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for future, chunk in futures.items():
+                if future not in handled and not future.cancelled():
+                    record(chunk, future)
+            try:
+                db.rollback()
+                _write_send_logs(db, send_logs)
+                db.commit()
+            except Exception:
+                logger.error(
+                    f"❌ Could not record {len(send_logs)} send results before retry",
+                    exc_info=True,
                 )
-                db.add(send_log)
-                failed_count += 1
+            raise
+
+        if throttled:
+            logger.warning(f"⏱️ SES throttled, retrying batch in 30 seconds")
+            _write_send_logs(db, send_logs)
+            db.commit()
+            raise self.retry(countdown=30)
         
         # ======================== COMMIT SEND LOGS ========================
         
+        _write_send_logs(db, send_logs)
         db.commit()
         
         logger.info(
@@ -309,3 +671,57 @@ def send_campaign_batch(self, campaign_id: str, subscriber_emails: list):
     
     finally:
         db.close()
+
+
+
+def _send_log_row(
+    campaign_id: uuid.UUID,
+    email: str,
+    status: str,
+    *,
+    ses_message_id: str | None = None,
+    sent_at: datetime | None = None,
+    error_message: str | None = None,
+    extra_data: dict,
+) -> dict:
+    """Build one CampaignSendLog row for _write_send_logs."""
+    return {
+        "campaign_id": campaign_id,
+        "subscriber_email": email,
+        "status": status,
+        "ses_message_id": ses_message_id,
+        "sent_at": sent_at,
+        "error_message": error_message,
+        "extra_data": extra_data,
+    }
+
+
+def _write_send_logs(db: Session, rows: list[dict]):
+    """
+    Upsert send logs with one INSERT ... ON CONFLICT statement.
+
+    A retried email updates its earlier log in place; a log already in a
+    terminal status (sent, bounced, complained) is never overwritten. Written rows are removed from `rows`.
+    """
+    if not rows:
+        return
+
+    stmt = pg_insert(CampaignSendLog)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[CampaignSendLog.campaign_id, CampaignSendLog.subscriber_email],
+            set_={
+                "status": stmt.excluded.status,
+                "ses_message_id": func.coalesce(
+                    stmt.excluded.ses_message_id, CampaignSendLog.ses_message_id
+                ),
+                "sent_at": func.coalesce(stmt.excluded.sent_at, CampaignSendLog.sent_at),
+                "error_message": stmt.excluded.error_message,
+                "extra_data": stmt.excluded.extra_data,
+                "updated_at": func.now(),
+            },
+            where=CampaignSendLog.status.not_in(TERMINAL_SEND_STATUSES),
+        ),
+        rows,
+    )
+    rows.clear()
@@ -0,0 +1,157 @@
+"""SES event consumer - applies bounce, complaint and rendering-failure events to send logs."""
+
+import json
+import boto3
+from sqlalchemy import update, bindparam
+from loguru import logger
+
+from app.celery_app import app
+from app.database.database import SessionLocal
+# Import all models with proper initialization order
+from app.database.models import CampaignSendLog
+from app.utils import constants
+
+
+sqs_client = boto3.client(
+    "sqs",
+    region_name=constants.AWS_SES_REGION,
+    aws_access_key_id=constants.AWS_SES_ACCESS_KEY_ID,
+    aws_secret_access_key=constants.AWS_SES_SECRET_ACCESS_KEY,
+)
+
+# SES eventType -> CampaignSendLog status; other events (Send, Delivery,
+# Open, ...) don't change a log. SendBulkTemplatedEmail reports Success for
+# a message SES later fails to render, so that event marks it failed.
+_EVENT_STATUS = {
+    "Bounce": "bounced",
+    "Complaint": "complained",
+    "Rendering Failure": "failed",
+}
+
+_send_logs = CampaignSendLog.__table__
+
+# Executed once per event with executemany
+_APPLY_EVENT = (
+    update(_send_logs)
+    .where(_send_logs.c.ses_message_id == bindparam("message_id"))
+    .values(
+        status=bindparam("new_status"),
+        error_message=bindparam("detail"),
+        updated_at=bindparam("event_time"),
+    )
+)
+
+
+def _parse_event(body: str) -> dict | None:
+    """
+    Turn an SQS message body into update parameters.
+
+    Handles both SNS-wrapped and raw-delivery messages.
+
+    Returns:
+        Parameters for _APPLY_EVENT, or None if the event is ignored
+    """
+    event = json.loads(body)
+    if event.get("Type") == "Notification":
+        event = json.loads(event["Message"])
+
+    event_type = event.get("eventType") or event.get("notificationType")
+    new_status = _EVENT_STATUS.get(event_type)
+    if not new_status:
+        return None
+
+    if event_type == "Bounce":
+        bounce = event.get("bounce", {})
+        detail = f"{bounce.get('bounceType', '')}/{bounce.get('bounceSubType', '')}"
+        event_time = bounce.get("timestamp")
+    elif event_type == "Rendering Failure":
+        failure = event.get("failure", {})
+        detail = failure.get("errorMessage") or "rendering failure"
+        event_time = None
+    else:
+        complaint = event.get("complaint", {})
+        detail = complaint.get("complaintFeedbackType") or "complaint"
+        event_time = complaint.get("timestamp")
+
+    return {
+        "message_id": event["mail"]["messageId"],
+        "new_status": new_status,
+        "detail": f"{event_type}: {detail}",
+        "event_time": event_time or event["mail"].get("timestamp"),
+    }
+
+
+@app.task(
+    name="app.workers.ses_events.process_ses_events",
+    bind=True,
+    queue="scheduled",
+    max_retries=3,
+)
+def process_ses_events(self):
+    """
+    Drain SES events published through the configuration set.
+
+    SES -> SNS -> SQS delivers bounce, complaint and rendering-failure events
+    for messages sent by send_campaign_batch. Each run receives up to 10
+    messages per call, applies them to campaign_send_logs by ses_message_id
+    in one executemany UPDATE per receive, commits, and only then deletes
+    them from the queue.
+    A failed run leaves its messages to be redelivered.
+    """
+    queue_url = constants.AWS_SES_EVENTS_QUEUE_URL
+    if not queue_url:
+        return {"status": "disabled"}
+
+    applied = 0
+    ignored = 0
+
+    db = SessionLocal()
+    try:
+        for _ in range(constants.SES_EVENTS_MAX_RECEIVES_PER_RUN):
+            messages = sqs_client.receive_message(
+                QueueUrl=queue_url,
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=1,
+            ).get("Messages", [])
+
+            if not messages:
+                break
+
+            updates = []
+            for message in messages:
+                try:
+                    params = _parse_event(message["Body"])
+                except (ValueError, KeyError):
+                    logger.warning(f"⚠️ Unparseable SES event {message['MessageId']}, dropping")
+                    params = None
+
+                if params:
+                    updates.append(params)
+                else:
+                    ignored += 1
+
+            if updates:
+                db.execute(_APPLY_EVENT, updates)
+                db.commit()
+                applied += len(updates)
+
+            sqs_client.delete_message_batch(
+                QueueUrl=queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                    for i, message in enumerate(messages)
+                ],
+            )
+
+        if applied or ignored:
+            logger.info(f"📬 SES events: {applied} applied, {ignored} ignored")
+
+        return {"status": "success", "applied": applied, "ignored": ignored}
+
+    except Exception as exc:
+        db.rollback()
+        logger.error(f"❌ SES event processing failed: {str(exc)}", exc_info=True)
+        raise self.retry(exc=exc, countdown=60)
+
+    finally:
+        db.close()